@@ -47,12 +47,20 @@ learned:
 - decrementing counts as we go allows for early returns and saves space
 """
 from typing import List
+
+from multiset import is_subset, probably_subset
+
 class Solution:
     def isSubset(self, a: List[int], b: List[int]) -> bool:
-        a_dict = {}
+        # the shared multiset kernel does the counting in C (Counter, or numpy for big int arrays)
+        # and bails out early if b is longer than a
+        # same O(n + m), just without a python-level dict update per element
+        return is_subset(b, a)
+
+        # a_dict = {}
 
-        for num in a:
-            a_dict[num] = a_dict.get(num, 0) + 1
+        # for num in a:
+        #     a_dict[num] = a_dict.get(num, 0) + 1
 
         # b_dict = {}
         
@@ -67,12 +75,20 @@ class Solution:
         #         return False
 
         # i came up with an optimized version of the above commented code
-        for num in b:
-            if num not in a_dict or a_dict[num] == 0:
-                return False
-            a_dict[num] -= 1
+        # for num in b:
+        #     if num not in a_dict or a_dict[num] == 0:
+        #         return False
+        #     a_dict[num] -= 1
         
-        return True
+        # return True
+
+    def isSubsetApprox(self, a, b, epsilon: float = 1e-3, delta: float = 1e-3) -> bool:
+        # for when a and b are too big to count exactly (or live on different machines)
+        # count-min sketches of both, one pass each, memory fixed by epsilon and delta
+        # False is a sure "no", True is "probably", a collision can hide a missing value
+        # time complexity: O((n + m) * ln(1 / delta))
+        # space complexity: O(1 / epsilon * ln(1 / delta)), doesn't grow with n
+        return probably_subset(b, a, epsilon, delta)
 
 
 if __name__ == "__main__": 
@@ -41,22 +41,36 @@ learned:
 - checking if dict is empty is easier than counting remaining elements
 """
 
+from multiset import is_equal, probably_equal
+
 class Solution:
     def checkEqual(self, a, b) -> bool:
-        a_dict = {}
+        # the shared multiset kernel counts both in C (Counter, or numpy for big int arrays)
+        # different lengths can't be equal, so that's checked before counting anything
+        return is_equal(a, b)
+
+        # a_dict = {}
 
-        for num in a:
-            a_dict[num] = a_dict.get(num, 0) + 1
+        # for num in a:
+        #     a_dict[num] = a_dict.get(num, 0) + 1
         
-        for num in b:
-            if num not in a_dict:
-                return False
-            a_dict[num] -= 1
+        # for num in b:
+        #     if num not in a_dict:
+        #         return False
+        #     a_dict[num] -= 1
             
-            if a_dict[num] == 0:
-                del a_dict[num]
+        #     if a_dict[num] == 0:
+        #         del a_dict[num]
         
-        return not a_dict
+        # return not a_dict
+
+    def checkEqualApprox(self, a, b, lanes: int = 2) -> bool:
+        # for when a and b are too big to count exactly (or live on different machines)
+        # hash every element, add the hashes up mod 2^64, order doesn't matter for a sum
+        # False is a sure "no", True is wrong with probability about 2^(-64 * lanes)
+        # time complexity: O((n + m) * lanes)
+        # space complexity: O(lanes)
+        return probably_equal(a, b, lanes)
 
 if __name__ == "__main__":
     a = list(map(int, input().split()))
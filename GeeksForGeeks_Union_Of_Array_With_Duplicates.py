@@ -28,13 +28,90 @@ learned:
 - converting to sets handles duplicates automatically
 - list comprehension isn't always needed - sometimes built-in methods are your friend
 """
+import heapq
+import operator
+from itertools import islice
+from typing import Iterable, Iterator, Sequence, TextIO
+
+
+def is_sorted(nums: Sequence) -> bool:
+    # one pass, each element against the next, map runs the comparisons in C
+    return all(map(operator.le, nums, islice(nums, 1, None)))
+
+
+def union_sorted(a: Sequence, b: Sequence) -> Iterator:
+    # the "just the arrays" version i gave up on, two pointers
+    # both sorted, so we always take the smaller front and skip anything equal to what we just gave
+    # no hashing, no set, yields the union in sorted order
+    i, j = 0, 0
+    n, m = len(a), len(b)
+    last = None
+    started = False
+    while i < n or j < m:
+        if j == m or (i < n and a[i] <= b[j]):
+            value = a[i]
+            i += 1
+        else:
+            value = b[j]
+            j += 1
+        if not started or value != last:
+            yield value
+            last, started = value, True
+
+
+def union_k_sorted(*iterables: Iterable) -> Iterator:
+    # the same thing for k sorted inputs, and they can be generators / files
+    # heapq.merge only holds the front of each input, so memory is O(k), not O(total)
+    # if an input isn't actually sorted the merged output goes backwards,
+    # so that's where we notice and complain
+    started = False
+    last = None
+    for value in heapq.merge(*iterables):
+        if started:
+            if value == last:
+                continue
+            if value < last:
+                raise ValueError(f"inputs must be sorted, got {value!r} after {last!r}")
+        yield value
+        last, started = value, True
+
+
+def iter_file(f: TextIO) -> Iterator[int]:
+    # one int per line, read lazily, so a sorted file can go straight into union_k_sorted
+    for line in f:
+        if line.strip():
+            yield int(line)
+
+
+def write_union(out: TextIO, *iterables: Iterable) -> int:
+    # stream the union of sorted inputs to a file, one per line, returns how many were written
+    count = 0
+    for value in union_k_sorted(*iterables):
+        out.write(f"{value}\n")
+        count += 1
+    return count
+
+
 class Solution:
     def findUnion(self, a, b):
+        # sorted inputs (gfg's usually are) get the two pointer merge, no hashing
+        # checking costs one O(n + m) pass, way cheaper than building two sets
+        # time complexity: O(n + m)
+        # space complexity: O(1) extra besides the output
+        if is_sorted(a) and is_sorted(b):
+            return list(union_sorted(a, b))
+
         a_set = set(a)
         b_set = set(b)
 
         return list(a_set.union(b_set))
 
+    def findUnionStream(self, *iterables):
+        # any number of sorted inputs, the union comes out as a generator, sorted
+        # time complexity: O(N log k), N = total elements, k = number of inputs
+        # space complexity: O(k)
+        return union_k_sorted(*iterables)
+
 if __name__ == "__main__":
     a = list(map(int, input().split()))
     b = list(map(int, input().split()))
@@ -70,7 +70,314 @@ alternatives:
 - sorting
 """
 
-from typing import List
+import heapq
+import math
+import operator
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from kernels import MASK64, as_int_array, mix64, mix64_array, np
+
+# how many values we pull out of the stream at a time
+CHUNK_SIZE = 1 << 16
+
+
+def has_duplicates(nums) -> bool:
+    # the sorting approach, done by numpy
+    # sort a copy (never nums itself), then compare each element with its neighbour
+    arr = as_int_array(nums)
+    if arr is None:
+        seen = set()
+        for num in nums:
+            if num in seen:
+                return True
+            seen.add(num)
+        return False
+    if len(arr) < 2:
+        return False
+    ordered = np.sort(arr)
+    return bool((ordered[1:] == ordered[:-1]).any())
+
+
+def find_duplicates(nums) -> Dict[int, int]:
+    # every value that shows up more than once -> how many times, smallest value first
+    arr = as_int_array(nums)
+    if arr is None:
+        return dict(sorted((num, count) for num, count in Counter(nums).items() if count > 1))
+    values, counts = np.unique(arr, return_counts=True)
+    repeated = counts > 1
+    return dict(zip(values[repeated].tolist(), counts[repeated].tolist()))
+
+
+def iter_chunks(source: Iterable, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    # the stream can be plain ints or chunks of them, or one big int array on its own
+    # a chunk is any integer buffer: array('q') / array('i'), memoryview, an int ndarray
+    # int64 buffers are used as they are, other integer types are converted
+    # either way we hand back int64 chunks so everything after this only sees one shape
+    if _is_int_buffer(source):
+        whole = _int64_chunk(source)
+        for start in range(0, len(whole), chunk_size):
+            yield whole[start:start + chunk_size]
+        return
+    batch = array("q")
+    for item in source:
+        try:
+            batch.append(operator.index(item)) # ints, numpy int scalars
+        except TypeError:
+            pass
+        else:
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = array("q")
+            continue
+        if batch:
+            yield batch
+            batch = array("q")
+        yield _int64_chunk(item)
+    if batch:
+        yield batch
+
+
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+INT_CODES = frozenset("bBhHiIlLqQnN")
+INT64_FORMATS = frozenset(prefix + code for prefix in ("", "@", "=", NATIVE_ORDER) for code in "ql")
+
+
+def _is_int_buffer(obj) -> bool:
+    if isinstance(obj, (bytes, bytearray, str)):
+        return False
+    try:
+        with memoryview(obj) as view:
+            return view.format.lstrip("@=<>!") in INT_CODES
+    except TypeError:
+        return False
+
+
+def _int64_chunk(item):
+    # an integer buffer as int64 values, no copy when it already is int64
+    # raw bytes are refused on purpose: they could be anything, say what they are with
+    # memoryview(data).cast("q") (or "i", ...) and they're fine
+    if isinstance(item, (bytes, bytearray)):
+        raise TypeError("raw bytes are ambiguous, pass memoryview(data).cast('q') (or the real item type)")
+    try:
+        view = memoryview(item)
+    except TypeError:
+        raise TypeError(f"expected ints or integer buffers, got {type(item).__name__}") from None
+    fmt = view.format
+    if view.itemsize == 8 and fmt in INT64_FORMATS and view.c_contiguous:
+        return view.cast("B").cast("q") # no copy
+    code = fmt.lstrip("@=<>!")
+    if code not in INT_CODES:
+        raise TypeError(f"expected an integer buffer, got format {fmt!r}")
+    if np is not None:
+        arr = np.asarray(item).ravel()
+        if arr.dtype == np.uint64 and len(arr) and arr.max() > np.iinfo(np.int64).max:
+            raise OverflowError("values past 2^63 - 1 don't fit in int64")
+        return memoryview(np.ascontiguousarray(arr, dtype=np.int64)).cast("B").cast("q")
+    if fmt[0] in "<>!" and fmt[0] != NATIVE_ORDER:
+        raise TypeError(f"can't read non-native byte order {fmt!r} without numpy")
+    return array("q", view.cast("B").cast(code)) # OverflowError for uint64 past 2^63 - 1
+
+
+class BloomFilter:
+    # a bit array + k hash functions
+    # add() says "maybe seen" if all k bits were already set, "definitely new" otherwise
+    # no false negatives, so a real duplicate is always flagged
+    # false positives happen at ~fp_rate once expected_items values are in
+    # memory is ~1.2 bytes per value at 1%, vs 100+ for a dict entry
+    # add() is a python loop per value, that's the no-numpy speed
+    # with numpy, add_many() hashes and tests a whole chunk at once, same bits either way
+
+    SEED = 0x9E3779B97F4A7C15
+
+    def __init__(self, expected_items: int, fp_rate: float = 0.01):
+        n = max(1, expected_items)
+        self.size = max(64, int(-n * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / n * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, value: int) -> bool:
+        # double hashing, k positions from two 64-bit mixes of the value
+        value &= MASK64
+        h1 = mix64(value)
+        h2 = mix64(value ^ self.SEED) | 1
+        bits, size = self.bits, self.size
+        seen = True
+        for i in range(self.hashes):
+            pos = ((h1 + i * h2) & MASK64) % size
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                seen = False
+                bits[pos >> 3] |= mask
+        return seen
+
+    def add_many(self, chunk) -> List[int]:
+        # add a chunk of int64s, return the ones that were maybe seen
+        # numpy: test every value against the bits as they were before the chunk,
+        # then set them all; a value repeating inside the chunk is flagged by sorting,
+        # so real duplicates still always come back
+        if np is None:
+            return [value for value in chunk if self.add(value)]
+        values = np.frombuffer(chunk, dtype=np.int64)
+        if not len(values):
+            return []
+        x = values.view(np.uint64)
+        h1 = mix64_array(x)
+        h2 = mix64_array(x ^ np.uint64(self.SEED)) | np.uint64(1)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        pos = (h1[:, None] + steps * h2[:, None]) % np.uint64(self.size) # uint64 wraps like & MASK64
+        at = (pos >> np.uint64(3)).astype(np.intp)
+        masks = np.left_shift(1, pos & np.uint64(7)).astype(np.uint8)
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        seen = ((bits[at] & masks) != 0).all(axis=1)
+        np.bitwise_or.at(bits, at.ravel(), masks.ravel())
+        ordered = np.sort(values)
+        repeats = ordered[1:][ordered[1:] == ordered[:-1]]
+        return np.union1d(values[seen], repeats).tolist()
+
+
+def find_first_duplicate(
+    source: Iterable,
+    expected_items: int = 1 << 20,
+    fp_rate: float = 0.01,
+    max_candidates: int = 1 << 20,
+    run_size: int = 1 << 20,
+    chunk_size: int = CHUNK_SIZE,
+) -> Optional[Tuple[int, int]]:
+    # the streaming version, for when nums doesn't fit in a dict (or in memory at all)
+    # returns (position, value) of the first value that repeats,
+    # position being where it shows up the second time, or None if everything is distinct
+    # values are 64-bit signed ints
+    #
+    # pass 1: run everything through a bloom filter, anything it flags is a candidate
+    # every real duplicate gets flagged, plus ~fp_rate false alarms
+    # pass 2: walk again, but only remember candidates, exactly
+    # the first candidate we meet twice is the answer
+    # so memory is the bloom bits + the candidates, not the whole input
+    # pass 1 runs per chunk in numpy when it's installed (a few million ids/s here)
+    # without it, it's a python loop per value, several times slower: the memory bound
+    # still holds but that's not the speed you want for billions of ids
+    #
+    # if the source is a one-shot iterator (a generator, a socket reader...)
+    # pass 1 spools it to a temp file so pass 2 has something to read
+    # if there are too many candidates (lots of real duplicates, or expected_items was way off)
+    # we give up on the bloom filter and external sort (value, position) pairs instead
+    one_shot = iter(source) is source
+    spool = tempfile.TemporaryFile() if one_shot else None
+
+    def replay() -> Iterator:
+        if spool is None:
+            return iter_chunks(source, chunk_size)
+        spool.seek(0)
+        return _read_spool(spool, chunk_size)
+
+    try:
+        bloom = BloomFilter(expected_items, fp_rate)
+        candidates = set()
+        overflow = False
+        for chunk in iter_chunks(source, chunk_size):
+            if spool is not None:
+                spool.write(chunk)
+            if overflow:
+                continue # still have to finish spooling
+            candidates.update(bloom.add_many(chunk))
+            if len(candidates) > max_candidates:
+                overflow = True
+                bloom = candidates = None # free them before sorting
+                if spool is None:
+                    break
+        if overflow:
+            return _sort_merge_first_duplicate(replay(), run_size)
+        if not candidates:
+            return None
+        return _confirm_first_duplicate(replay(), candidates)
+    finally:
+        if spool is not None:
+            spool.close()
+
+
+def _read_spool(spool, chunk_size: int) -> Iterator:
+    while True:
+        data = spool.read(chunk_size * 8)
+        if not data:
+            return
+        yield memoryview(data).cast("q")
+
+
+def _confirm_first_duplicate(chunks: Iterator, candidates: set) -> Optional[Tuple[int, int]]:
+    # the fifth approach again, but only candidates go in the "seen" set
+    seen = set()
+    pos = 0
+    for chunk in chunks:
+        for value in chunk:
+            if value in candidates:
+                if value in seen:
+                    return pos, value
+                seen.add(value)
+            pos += 1
+    return None
+
+
+def _sort_merge_first_duplicate(chunks: Iterator, run_size: int) -> Optional[Tuple[int, int]]:
+    # the sorting approach, but out of memory
+    # sort (value, position) pairs in runs of run_size, write each run to a temp file,
+    # then heapq.merge the runs back in (value, position) order
+    # equal values end up next to each other, positions ascending,
+    # so the 2nd record of a value is where it repeats first
+    # answer is the smallest of those
+    runs = []
+    try:
+        buf = []
+        pos = 0
+        for chunk in chunks:
+            for value in chunk:
+                buf.append((value, pos))
+                pos += 1
+                if len(buf) >= run_size:
+                    runs.append(_write_run(buf))
+                    buf = []
+        if buf:
+            runs.append(_write_run(buf))
+
+        best = None
+        prev, count = None, 0
+        for value, pos in heapq.merge(*(_read_run(run) for run in runs)):
+            if value == prev:
+                count += 1
+                if count == 2 and (best is None or pos < best[0]):
+                    best = (pos, value)
+            else:
+                prev, count = value, 1
+        return best
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _write_run(buf: list):
+    buf.sort()
+    run = tempfile.TemporaryFile()
+    flat = array("q")
+    for value, pos in buf:
+        flat.append(value)
+        flat.append(pos)
+    run.write(flat)
+    run.seek(0)
+    return run
+
+
+def _read_run(run) -> Iterator[Tuple[int, int]]:
+    while True:
+        data = run.read(CHUNK_SIZE * 16)
+        if not data:
+            return
+        flat = memoryview(data).cast("q")
+        for i in range(0, len(flat), 2):
+            yield flat[i], flat[i + 1]
+
 
 class Solution:
     def contains_duplicate(self, nums: List[int]) -> bool:
@@ -144,6 +451,26 @@ class Solution:
         # time complexity: O(n)
         # space complexity: O(n)
 
+    def contains_duplicate_stream(self, nums: Iterable, **kwargs) -> bool:
+        # same question, but nums can be any iterable of ints or integer chunks (array, ndarray), as big as you like
+        # see find_first_duplicate for how, kwargs go straight to it
+        # time complexity: O(n) with the bloom filter, O(n log n) if it falls back to sorting
+        # space complexity: O(n) bits + O(duplicates) for the bloom path, O(run_size) for sorting
+        return find_first_duplicate(nums, **kwargs) is not None
+
+    def contains_duplicate_array(self, nums) -> bool:
+        # same question for big in-memory int arrays (list, array('q'), memoryview, ndarray)
+        # numpy sorts and compares neighbours when it's installed, the set loop otherwise
+        # time complexity: O(n log n) but in C
+        # space complexity: O(n) for the sorted copy
+        return has_duplicates(nums)
+
+    def find_duplicates(self, nums) -> Dict[int, int]:
+        # not just "is there one", but which values repeat and how often
+        # time complexity: O(n log n) with numpy (np.unique sorts), O(n) without
+        # space complexity: O(n)
+        return find_duplicates(nums)
+
 if __name__ == "__main__":
     nums = list(map(int, input().split()))
     solution = Solution()
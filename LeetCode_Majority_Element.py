@@ -54,7 +54,171 @@ alternatives:
 - Boyer-Moore Voting Algorithm is pretty optimal for this problem
 - using divide and conquer, we can divide the array into two halves, find the majority element in each half, and then combine the results
 """
-from typing import List
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# values per task handed to a worker
+CHUNK_SIZE = 1 << 20
+
+
+class FileRange(NamedTuple):
+    # values [start, stop) of a raw little-endian int64 file
+    # workers get this instead of the numbers, so nothing big gets pickled
+    path: str
+    start: int
+    stop: int
+
+    def load(self) -> array:
+        chunk = array("q")
+        with open(self.path, "rb") as f:
+            f.seek(self.start * 8)
+            chunk.frombytes(f.read((self.stop - self.start) * 8))
+        return chunk
+
+
+def boyer_moore(nums: Iterable[int]) -> Tuple[Optional[int], int]:
+    # the second approach, but it also hands back the count
+    # (candidate, count) is a summary of the chunk we can merge with other chunks
+    count = 0
+    candidate = None
+    for num in nums:
+        if count == 0:
+            candidate = num
+        if num == candidate:
+            count += 1
+        else:
+            count -= 1
+    return candidate, count
+
+
+def merge_summaries(a: Tuple[Optional[int], int], b: Tuple[Optional[int], int]) -> Tuple[Optional[int], int]:
+    # gluing two chunks together is the same as running boyer-moore on both:
+    # same candidate, the counts add up
+    # different candidates, they cancel each other out and the bigger one survives
+    # the majority of the whole array is the majority of at least one chunk
+    # and always survives the cancelling, same argument as the single loop
+    (cand_a, count_a), (cand_b, count_b) = a, b
+    if cand_a == cand_b:
+        return cand_a, count_a + count_b
+    if count_a >= count_b:
+        return cand_a, count_a - count_b
+    return cand_b, count_b - count_a
+
+
+def misra_gries(nums: Iterable[int], k: int) -> Dict[int, int]:
+    # boyer-moore with k - 1 candidates instead of one
+    # anything showing up more than n / k times is guaranteed to be kept
+    # (the counts are lower bounds, so still needs a counting pass to be sure)
+    # k == 2 is exactly boyer-moore
+    counters = {}
+    for num in nums:
+        if num in counters:
+            counters[num] += 1
+        elif len(counters) < k - 1:
+            counters[num] = 1
+        else:
+            # num cancels one of everything, the decrements are paid for by earlier increments
+            for key in list(counters):
+                counters[key] -= 1
+                if counters[key] == 0:
+                    del counters[key]
+    return counters
+
+
+def merge_misra_gries(a: Dict[int, int], b: Dict[int, int], k: int) -> Dict[int, int]:
+    # add the counters up, then if there are more than k - 1
+    # knock the k-th biggest count off all of them and keep what's still positive
+    merged = dict(a)
+    for num, count in b.items():
+        merged[num] = merged.get(num, 0) + count
+    if len(merged) < k:
+        return merged
+    cut = sorted(merged.values(), reverse=True)[k - 1]
+    return {num: count - cut for num, count in merged.items() if count > cut}
+
+
+def _split(source, chunk_size: int) -> Iterator:
+    # a path means a raw int64 file, split into ranges the workers read themselves
+    # anything else is sliced, lists and arrays keep their type (both have a C count())
+    if isinstance(source, (str, os.PathLike)):
+        n = os.path.getsize(source) // 8
+        for start in range(0, n, chunk_size):
+            yield FileRange(os.fspath(source), start, min(n, start + chunk_size))
+        return
+    for start in range(0, len(source), chunk_size):
+        chunk = source[start:start + chunk_size]
+        yield chunk if isinstance(chunk, (list, array)) else array("q", chunk)
+
+
+def _load(chunk):
+    return chunk.load() if isinstance(chunk, FileRange) else chunk
+
+
+def _summary_task(chunk) -> Tuple[Optional[int], int]:
+    return boyer_moore(_load(chunk))
+
+
+def _misra_gries_task(chunk, k: int) -> Dict[int, int]:
+    return misra_gries(_load(chunk), k)
+
+
+def _count_task(chunk, values: List[int]) -> Tuple[int, List[int]]:
+    chunk = _load(chunk)
+    return len(chunk), [chunk.count(value) for value in values]
+
+
+def _map(fn, chunks: Iterator, jobs: int, *args) -> Iterator:
+    # jobs <= 1 runs in this process, same functions, no pool to spin up
+    if jobs <= 1:
+        return (fn(chunk, *args) for chunk in chunks)
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return iter(list(pool.map(fn, chunks, *(repeat(arg) for arg in args))))
+
+
+def _exact_counts(source, values: List[int], jobs: int, chunk_size: int) -> Tuple[int, List[int]]:
+    n = 0
+    totals = [0] * len(values)
+    for size, counts in _map(_count_task, _split(source, chunk_size), jobs, values):
+        n += size
+        totals = [total + count for total, count in zip(totals, counts)]
+    return n, totals
+
+
+def majority_parallel(source, jobs: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Optional[int]:
+    # boyer-moore across a process pool
+    # source is a list / array('q') / anything sliceable, or the path of a raw int64 file
+    # pass 1: every chunk gets a (candidate, count) summary, merged pairwise
+    # pass 2: count the winner in every chunk, it's only the answer if it's > n / 2
+    # unlike majority_element this doesn't assume there is one, None if there isn't
+    jobs = jobs or os.cpu_count() or 1
+    summary = (None, 0)
+    for part in _map(_summary_task, _split(source, chunk_size), jobs):
+        summary = merge_summaries(summary, part)
+    candidate = summary[0]
+    if candidate is None:
+        return None
+    n, (count,) = _exact_counts(source, [candidate], jobs, chunk_size)
+    return candidate if count > n // 2 else None
+
+
+def heavy_hitters_parallel(source, k: int, jobs: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Dict[int, int]:
+    # misra-gries across a process pool, same two passes as majority_parallel
+    # returns every value showing up more than n / k times -> its exact count
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    jobs = jobs or os.cpu_count() or 1
+    summary = {}
+    for part in _map(_misra_gries_task, _split(source, chunk_size), jobs, k):
+        summary = merge_misra_gries(summary, part, k)
+    candidates = sorted(summary)
+    if not candidates:
+        return {}
+    n, counts = _exact_counts(source, candidates, jobs, chunk_size)
+    return {value: count for value, count in zip(candidates, counts) if count > n // k}
+
 
 class Solution:
     def majority_element(self, nums: List[int]) -> int:
@@ -94,6 +258,20 @@ class Solution:
         # time complexity: O(n)
         # space complexity: O(1)
 
+    def majority_element_parallel(self, nums, jobs: Optional[int] = None) -> Optional[int]:
+        # same answer spread over jobs processes, nums can also be a raw int64 file path
+        # returns None instead of garbage when there's no majority
+        # time complexity: O(n / jobs) per pass, two passes
+        # space complexity: O(chunks) for the summaries
+        return majority_parallel(nums, jobs)
+
+    def majority_elements(self, nums, k: int, jobs: Optional[int] = None) -> List[int]:
+        # the general version, every element showing up more than n / k times
+        # k == 2 is this problem, k == 3 is majority element II
+        # time complexity: O(n) amortized, O(n / jobs) per pass with a pool
+        # space complexity: O(k) per chunk
+        return sorted(heavy_hitters_parallel(nums, k, jobs))
+
 
 if __name__ == "__main__":
     nums = list(map(int, input().split()))
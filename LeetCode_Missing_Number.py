@@ -52,7 +52,346 @@ alternative:
 - but the sum approach is more intuitive for this problem
 """
 
-from typing import List
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from kernels import np
+
+# values per block, 8 MiB of int64s
+BLOCK_SIZE = 1 << 20
+# a roaring container covers 2^16 ids, past this many it's smaller as a bitmap than a sorted array
+ARRAY_MAX = 4096
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+def scan_blocks(source, fn: Callable, dtype: str = "q", block_size: int = BLOCK_SIZE) -> Iterator:
+    # runs fn over source a block at a time and yields what it returns
+    # source is a path to a raw little-endian file of dtype ("q", "i", "Q", "I"),
+    # a buffer of them (bytes, array, memoryview, ndarray), or any iterable of ints
+    # typed buffers have to match dtype (TypeError if not), bytes are taken as the raw file
+    # files are mmapped, nothing is ever loaded whole
+    # blocks are ndarrays with numpy, memoryviews (or arrays) without
+    # fn gets a view into the file, so it shouldn't hang on to the block
+    # (that's why this takes fn instead of just yielding blocks)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from _scan_buffer(mm, fn, dtype, block_size)
+        return
+    try:
+        memoryview(source).release()
+    except TypeError: # a plain stream of ints
+        block = array(dtype)
+        for num in source:
+            block.append(num)
+            if len(block) >= block_size:
+                yield fn(_native(block))
+                block = array(dtype)
+        if block:
+            yield fn(_native(block))
+        return
+    yield from _scan_buffer(source, fn, dtype, block_size)
+
+
+def _native(block: array):
+    return np.frombuffer(block, dtype=block.typecode) if np is not None else block
+
+
+def _scan_buffer(buf, fn: Callable, dtype: str, block_size: int) -> Iterator:
+    with memoryview(buf) as whole, whole.cast("B") as raw:
+        order = _byte_order(whole, dtype)
+        itemsize = array(dtype).itemsize
+        step = block_size * itemsize
+        for start in range(0, len(raw) - len(raw) % itemsize, step):
+            stop = min(start + step, len(raw) - len(raw) % itemsize)
+            if np is not None:
+                block = np.frombuffer(raw[start:stop], dtype=np.dtype(dtype).newbyteorder(order))
+                result = fn(block)
+                del block # let go of the mmap before it gets closed
+                yield result
+                continue
+            with raw[start:stop] as part, part.cast(dtype) as block:
+                if order != NATIVE_ORDER:
+                    swapped = array(dtype, block)
+                    swapped.byteswap()
+                    yield fn(swapped)
+                else:
+                    yield fn(block)
+
+
+def _byte_order(view: memoryview, dtype: str) -> str:
+    # plain bytes (bytes, bytearray, mmap) are raw file contents, little-endian dtype
+    # a typed buffer has to already hold dtype, an int32 array is not read as int64
+    fmt = view.format
+    if fmt in ("B", "c"):
+        return "<"
+    code = fmt.lstrip("@=<>!")
+    signed_ok = len(code) == 1 and code in "bhilqnBHILQN" and code.islower() == dtype.islower()
+    if not signed_ok or view.itemsize != array(dtype).itemsize:
+        raise TypeError(f"buffer holds {fmt!r} items, not {dtype!r}: pass dtype to match it, or raw bytes")
+    if fmt[0] in "<>!":
+        return "<" if fmt[0] == "<" else ">"
+    return NATIVE_ORDER
+
+
+def _xor_upto(n: int) -> int:
+    # 0 ^ 1 ^ ... ^ n, it repeats every 4
+    if n < 0:
+        return 0
+    return (n, 1, n + 1, 0)[n % 4]
+
+
+def _count_and_fold(block):
+    # numpy: xor the block, can't overflow like a sum of a few billion ids could
+    # python: sum() over a memoryview runs in C and python ints don't overflow
+    if np is not None and isinstance(block, np.ndarray):
+        return len(block), int(np.bitwise_xor.reduce(block)) if len(block) else 0
+    return len(block), sum(block)
+
+
+def missing_number_stream(source, lo: int = 0, dtype: str = "q", block_size: int = BLOCK_SIZE) -> int:
+    # the same question over a file / buffer / stream too big to be a list
+    # source holds every number in [lo, lo + n] except one, n being how many there are
+    # O(1) memory: each block is reduced to (count, xor) or (count, sum) on its own
+    # and we only keep the running totals
+    if lo < 0:
+        raise ValueError("lo must be non-negative")
+    count, folded, xored = 0, 0, None
+    for size, value in scan_blocks(source, _count_and_fold, dtype, block_size):
+        count += size
+        if np is not None:
+            xored = value if xored is None else xored ^ value
+        else:
+            folded += value
+    hi = lo + count
+    if np is not None:
+        return _xor_upto(hi) ^ _xor_upto(lo - 1) ^ (xored or 0)
+    return (lo + hi) * (hi - lo + 1) // 2 - folded
+
+
+class Bitmap:
+    # one bit per number in [lo, ...), grows as bigger numbers show up
+    # 1 bit instead of a set's ~60 bytes per number
+
+    def __init__(self, lo: int = 0):
+        self.lo = lo
+        self.size = 0 # highest bit set + 1
+        self.bits = np.zeros(0, dtype=np.uint8) if np is not None else bytearray()
+
+    def add_block(self, block) -> int:
+        if np is not None and isinstance(block, np.ndarray):
+            if not len(block):
+                return 0
+            idx = block.astype(np.int64) - self.lo
+            if idx.min() < 0:
+                raise ValueError(f"{int(idx.min()) + self.lo} is below lo={self.lo}")
+            self._grow(int(idx.max()) + 1)
+            np.bitwise_or.at(self.bits, idx >> 3, np.left_shift(1, idx & 7).astype(np.uint8))
+            return len(block)
+        for num in block:
+            i = num - self.lo
+            if i < 0:
+                raise ValueError(f"{num} is below lo={self.lo}")
+            self._grow(i + 1)
+            self.bits[i >> 3] |= 1 << (i & 7)
+        return len(block)
+
+    def _grow(self, size: int) -> None:
+        if size <= self.size:
+            return
+        self.size = size
+        need = (size + 7) // 8
+        if need > len(self.bits):
+            extra = max(need, 2 * len(self.bits)) - len(self.bits) # doubling, so it's amortized O(1)
+            if np is not None:
+                self.bits = np.concatenate((self.bits, np.zeros(extra, dtype=np.uint8)))
+            else:
+                self.bits.extend(bytes(extra))
+
+    def missing(self, hi: int) -> List[int]:
+        # every number in [lo, hi] whose bit isn't set
+        size = hi - self.lo + 1
+        if self.size > size:
+            raise ValueError(f"{self.lo + self.size - 1} is above hi={hi}")
+        if np is not None:
+            bits = np.unpackbits(self.bits, bitorder="little")[:size]
+            gaps = np.flatnonzero(bits == 0)
+            tail = np.arange(len(bits), size) # past the end of the bitmap, never set
+            return (np.concatenate((gaps, tail)) + self.lo).tolist()
+        bits = self.bits
+        return [self.lo + i for i in range(size) if i >= 8 * len(bits) or not bits[i >> 3] >> (i & 7) & 1]
+
+class RoaringBitmap:
+    # a bitmap for sparse ids, roaring style
+    # ids are split by their top bits (id >> 16) into containers of 65536 ids each
+    # a container with few ids is a sorted array('H') of the low 16 bits, 2 bytes per id
+    # once it passes ARRAY_MAX ids it turns into a plain 8 KiB bitmap
+    # ranges with no ids at all have no container, so a huge range with a few ids costs nothing
+    # memory follows how many ids there are (and how clumped), not how wide the range is
+
+    def __init__(self, values: Iterable[int] = ()):
+        self.containers: Dict[int, object] = {}
+        self.update(values)
+
+    def add(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"ids must be non-negative, got {value}")
+        key, low = value >> 16, value & 0xFFFF
+        container = self.containers.get(key)
+        if container is None:
+            self.containers[key] = array("H", [low])
+        elif isinstance(container, bytearray):
+            container[low >> 3] |= 1 << (low & 7)
+        else:
+            i = bisect_left(container, low)
+            if i == len(container) or container[i] != low:
+                container.insert(i, low)
+                if len(container) > ARRAY_MAX:
+                    self.containers[key] = _to_bitmap(container)
+
+    def update(self, values: Iterable[int]) -> int:
+        # add a block of ids, returns how many came in
+        # with numpy a block is grouped by container and merged in one go per container
+        if np is not None and isinstance(values, np.ndarray):
+            if not len(values):
+                return 0
+            if values.min() < 0:
+                raise ValueError(f"ids must be non-negative, got {int(values.min())}")
+            ids = np.unique(values.astype(np.int64))
+            keys = ids >> 16
+            starts = np.flatnonzero(np.diff(keys, prepend=-1))
+            for key, part in zip(keys[starts].tolist(), np.split(ids, starts[1:])):
+                self._merge_lows(key, (part & 0xFFFF).astype(np.uint16))
+            return len(values)
+        count = 0
+        for value in values:
+            self.add(value)
+            count += 1
+        return count
+
+    def _merge_lows(self, key: int, lows) -> None:
+        # lows: sorted, distinct uint16 ndarray
+        container = self.containers.get(key)
+        if isinstance(container, bytearray):
+            np.bitwise_or.at(np.frombuffer(container, dtype=np.uint8), lows >> 3,
+                             np.left_shift(1, lows & 7).astype(np.uint8))
+            return
+        if container is not None:
+            lows = np.union1d(np.frombuffer(container, dtype=np.uint16), lows)
+        merged = array("H", lows.astype(np.uint16).tobytes())
+        self.containers[key] = _to_bitmap(merged) if len(merged) > ARRAY_MAX else merged
+
+    def __ior__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        # merging shards: container by container, same key means same 65536 ids
+        for key, theirs in other.containers.items():
+            ours = self.containers.get(key)
+            if ours is None:
+                self.containers[key] = theirs[:] # a copy, other keeps its own
+            elif isinstance(ours, bytearray) or isinstance(theirs, bytearray):
+                ours, theirs = (ours, theirs) if isinstance(ours, bytearray) else (theirs, ours)
+                merged = _to_bitmap(theirs) if not isinstance(theirs, bytearray) else theirs
+                both = int.from_bytes(ours, "little") | int.from_bytes(merged, "little")
+                self.containers[key] = bytearray(both.to_bytes(8192, "little"))
+            else:
+                merged = array("H", sorted(set(ours).union(theirs)))
+                self.containers[key] = _to_bitmap(merged) if len(merged) > ARRAY_MAX else merged
+        return self
+
+    def __contains__(self, value: int) -> bool:
+        container = self.containers.get(value >> 16)
+        if container is None or value < 0:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, bytearray):
+            return bool(container[low >> 3] >> (low & 7) & 1)
+        i = bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def __len__(self) -> int:
+        return sum(
+            bin(int.from_bytes(c, "little")).count("1") if isinstance(c, bytearray) else len(c)
+            for c in self.containers.values()
+        )
+
+    def nbytes(self) -> int:
+        # roughly what the containers take, without python's object overhead
+        return sum(len(c) if isinstance(c, bytearray) else 2 * len(c) for c in self.containers.values())
+
+    def max(self) -> Optional[int]:
+        if not self.containers:
+            return None
+        key = max(self.containers)
+        return (key << 16) + _lows(self.containers[key])[-1]
+
+    def missing_ranges(self, lo: int, hi: int) -> List[Tuple[int, int]]:
+        # every gap in [lo, hi] as an inclusive (first, last) pair
+        # same idea as missing_number, just walking present ids and
+        # reporting whenever the next one isn't the last one + 1
+        # containers that don't exist are skipped in O(1), they're one big gap
+        gaps = []
+        prev = lo - 1 # last id known present (or just before lo)
+        for key in sorted(k for k in self.containers if lo >> 16 <= k <= hi >> 16):
+            base = key << 16
+            lows = _lows(self.containers[key])
+            if np is not None:
+                ids = np.asarray(lows, dtype=np.int64) + base
+                ids = ids[(ids >= lo) & (ids <= hi)]
+                if not len(ids):
+                    continue
+                steps = np.diff(ids, prepend=prev)
+                for i in np.flatnonzero(steps > 1).tolist():
+                    gaps.append((int(ids[i] - steps[i] + 1), int(ids[i] - 1)))
+                prev = int(ids[-1])
+                continue
+            for low in lows:
+                value = base + low
+                if value < lo or value > hi:
+                    continue
+                if value > prev + 1:
+                    gaps.append((prev + 1, value - 1))
+                prev = value
+        if prev < hi:
+            gaps.append((prev + 1, hi))
+        return gaps
+
+
+def _to_bitmap(lows: array) -> bytearray:
+    bits = bytearray(8192)
+    for low in lows:
+        bits[low >> 3] |= 1 << (low & 7)
+    return bits
+
+
+def _lows(container):
+    # the low 16 bits of every id in a container, ascending
+    if not isinstance(container, bytearray):
+        return container
+    if np is not None:
+        return np.flatnonzero(np.unpackbits(np.frombuffer(container, dtype=np.uint8), bitorder="little"))
+    return [i * 8 + bit for i, byte in enumerate(container) if byte for bit in range(8) if byte >> bit & 1]
+
+
+def missing_ranges(source, lo: int = 0, hi: Optional[int] = None, dtype: str = "q",
+                   bitmap: Optional[RoaringBitmap] = None) -> List[Tuple[int, int]]:
+    # the many-gaps version of missing_number: every missing (first, last) range in [lo, hi]
+    # hi defaults to the biggest id seen
+    # pass a bitmap to keep it around: feed it more ids later and ask again,
+    # or build one per shard and |= them together
+    bitmap = RoaringBitmap() if bitmap is None else bitmap
+    for _ in scan_blocks(source, bitmap.update, dtype):
+        pass
+    if hi is None:
+        hi = bitmap.max()
+        if hi is None:
+            return []
+    return bitmap.missing_ranges(lo, hi)
+
 
 class Solution:
     # leetcode's function name is missingNumber, but python convention is snake_case
@@ -98,6 +437,27 @@ class Solution:
         # ps: you can't do better than this in terms of time and space complexity      
         return expected_sum
 
+    def missing_number_stream(self, source, dtype: str = "q") -> int:
+        # same answer for a file path, buffer or stream of ints, without a list
+        # time complexity: O(n), vectorized per block with numpy
+        # space complexity: O(1), plus one block at a time
+        return missing_number_stream(source, dtype=dtype)
+
+    def missing_numbers(self, source, k: int, lo: int = 0, dtype: str = "q") -> List[int]:
+        # k numbers missing instead of one: source is [lo, lo + n + k - 1] minus k numbers
+        # the sum / xor trick only has one equation, so this marks a bitmap instead
+        # time complexity: O(n)
+        # space complexity: O(n) bits
+        bitmap = Bitmap(lo)
+        count = sum(scan_blocks(source, bitmap.add_block, dtype))
+        return bitmap.missing(lo + count + k - 1)
+
+    def missing_ranges(self, source, lo: int = 0, hi: Optional[int] = None, dtype: str = "q") -> List[Tuple[int, int]]:
+        # no idea how many are missing, just report every gap in [lo, hi]
+        # time complexity: O(n log n) worst case (sorted inserts), O(n) per block with numpy
+        # space complexity: O(n) ids, compressed, O(1) for ranges with nothing in them
+        return missing_ranges(source, lo, hi, dtype)
+
 if __name__ == "__main__":
     nums = list(map(int, input().split()))
     solution = Solution()   
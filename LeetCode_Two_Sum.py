@@ -56,7 +56,130 @@ learned:
 ps: for some reason, i forget the last point sometimes
 """
 
-from typing import List
+import operator
+from bisect import bisect_left
+from typing import Iterable, List
+
+from kernels import NUMPY_MIN_SIZE, np
+
+# the numpy path still walks this many nums in python first, pairs found early are cheap
+NUMPY_BLOCK = 1024
+
+
+def as_int(num) -> int:
+    # ints (and numpy ints) as they are, 3.0 as 3, anything else is refused
+    # the numpy path works in int64, so 2.5 would quietly turn into 2 there
+    try:
+        return operator.index(num)
+    except TypeError:
+        if isinstance(num, float) and num.is_integer():
+            return int(num)
+        raise TypeError(f"TwoSumIndex needs integers, got {num!r}") from None
+
+
+class TwoSumIndex:
+    # the batch version
+    # two_sum rebuilds num_to_index from scratch for every target
+    # but if the nums don't change and only the targets do, we can build it once
+    # first[num] is the first index num shows up at
+    # so "have we seen the complement before j" is just first[complement] < j
+    # positions[num] is every index of num (ascending), we need it because
+    # two_sum overwrites num_to_index, so it returns the *last* complement before j
+    # and we want to give back exactly what two_sum would
+
+    def __init__(self, nums: Iterable[int]):
+        self.nums = [as_int(num) for num in nums]
+        self.first = {}
+        self.positions = {}
+        for i, num in enumerate(self.nums): # O(n), once
+            if num in self.first:
+                self.positions[num].append(i)
+            else:
+                self.first[num] = i
+                self.positions[num] = [i]
+        self._arrays = None # numpy view, built on first use
+
+    def query(self, target: int) -> List[int]:
+        # same walk as two_sum, minus the dictionary insertions
+        target = as_int(target)
+        first = self.first
+        for j, num in enumerate(self.nums):
+            i = first.get(target - num)
+            if i is not None and i < j:
+                return [self._last_before(target - num, j), j]
+        return []
+
+    def query_many(self, targets: Iterable[int], as_array: bool = False):
+        # one [i, j] (or [] if there's no pair) per target, same as calling two_sum
+        # as_array gives a (len(targets), 2) int64 ndarray instead, -1 where there's no pair
+        if as_array and np is None:
+            raise ImportError("as_array=True needs numpy")
+        targets = [as_int(t) for t in targets]
+        arrays = self._numpy_arrays()
+        query = self.query if arrays is None else self._query_numpy
+        pairs = [query(t) for t in targets]
+        if not as_array:
+            return pairs
+        out = np.full((len(pairs), 2), -1, dtype=np.int64)
+        for row, pair in enumerate(pairs):
+            if pair:
+                out[row] = pair
+        return out
+
+    def _last_before(self, num: int, j: int) -> int:
+        positions = self.positions[num]
+        return positions[bisect_left(positions, j) - 1] # O(log k)
+
+    def _numpy_arrays(self):
+        if self._arrays is None:
+            if np is None or len(self.nums) < NUMPY_MIN_SIZE:
+                return None
+            # keep well inside int64 so target - num can't wrap around
+            if max(self.nums) >= 2**62 or min(self.nums) <= -2**62:
+                return None
+            # sorted distinct values, where each shows up first,
+            # and where it shows up second (n if it doesn't) for num + num == target
+            n = len(self.nums)
+            uniq, first = np.unique(np.asarray(self.nums, dtype=np.int64), return_index=True)
+            second = np.array(
+                [p[1] if len(p) > 1 else n for p in (self.positions[int(v)] for v in uniq)],
+                dtype=np.int64,
+            )
+            self._arrays = (uniq, first, second)
+        return self._arrays
+
+    def _query_numpy(self, target: int) -> List[int]:
+        # same answer as query(), without walking j one by one
+        # a value pair (v, w) with v + w == target first completes at
+        # j = max(first[v], first[w]) (or the second v if v == w)
+        # two_sum's j is the smallest of those over all pairs
+        # uniq is sorted and so is target - uniq reversed, so a stable sort of
+        # the two glued together is just a merge, and values sitting next to
+        # an equal one are the w's whose complement exists
+        # the first block is still walked in python, lots of pairs show up early
+        # and a short loop beats the numpy calls
+        uniq, first, second = self._arrays
+        if not -2**62 < target < 2**62:
+            return self.query(target)
+        lookup = self.first
+        for j in range(NUMPY_BLOCK):
+            num = self.nums[j]
+            i = lookup.get(target - num)
+            if i is not None and i < j:
+                return [self._last_before(target - num, j), j]
+
+        merged = np.sort(np.concatenate((uniq, target - uniq[::-1])), kind="stable")
+        w_vals = merged[1:][merged[1:] == merged[:-1]]
+        if not len(w_vals):
+            return []
+        w = np.searchsorted(uniq, w_vals)
+        v = np.searchsorted(uniq, target - w_vals)
+        done_at = np.where(v == w, second[v], np.maximum(first[v], first[w]))
+        j = int(done_at.min())
+        if j >= len(self.nums): # only num + num pairs, and num shows up once
+            return []
+        return [self._last_before(target - self.nums[j], j), j]
+
 
 class Solution:
     def two_sum(self, nums: List[int], target: int) -> List[int]:
@@ -98,6 +221,14 @@ class Solution:
         # space complexity is O(n) for the dictionary storage
         return []
 
+    def two_sum_batch(self, nums: List[int], targets: List[int]) -> List[List[int]]:
+        # many targets, same nums: build the index once instead of per target
+        # each answer is exactly what two_sum(nums, target) returns
+        # integers only (3.0 is fine), anything else is a TypeError instead of a truncated answer
+        # time complexity: O(n) to build + O(n) worst case per target (numpy does the O(n) in C)
+        # space complexity: O(n) for the index
+        return TwoSumIndex(nums).query_many(targets)
+
 
 if __name__ == "__main__":
     nums = list(map(int, input().split()))
@@ -0,0 +1,86 @@
+"""
+repo: dsa-grind
+
+purpose:
+- shared helpers for the numpy-optional kernels in the solution files
+  (LeetCode_Two_Sum, LeetCode_Contains_Duplicate, LeetCode_Missing_Number, multiset.py)
+- numpy is optional: every kernel has a plain-python path and picks numpy
+  only when it's installed and the input is worth converting
+- 64-bit hashing that gives the same answer with and without numpy
+"""
+
+from __future__ import annotations
+
+import sys
+import contextlib
+from types import ModuleType
+from typing import Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# below this many values turning a list into an ndarray costs more than a python loop saves
+NUMPY_MIN_SIZE = 2048
+
+MASK64 = (1 << 64) - 1
+
+def as_int_array(values) -> Optional["np.ndarray"]:
+    """
+    Return values as a 1-d integer ndarray, or None to stay in python.
+    Buffers (array('q'), memoryview, ndarray) are viewed without copying;
+    lists and tuples are only converted past NUMPY_MIN_SIZE. Floats, objects
+    and ints that don't fit a numpy integer type stay in python.
+    """
+    if np is None:
+        return None
+    if isinstance(values, np.ndarray):
+        arr = values
+    elif isinstance(values, (list, tuple)):
+        if len(values) < NUMPY_MIN_SIZE:
+            return None
+        try:
+            arr = np.array(values)
+        except OverflowError:
+            return None
+    else:
+        try:
+            arr = np.asarray(memoryview(values))
+        except TypeError:  # generators, sets, strings...
+            return None
+    if arr.dtype.kind not in "iu":
+        return None
+    return arr.ravel()
+
+def as_uint64_array(arr: "np.ndarray") -> "np.ndarray":
+    """An integer array's values mod 2^64, as uint64 (what `value & MASK64` does to an int)."""
+    if arr.dtype == np.uint64:
+        return arr
+    if arr.dtype.kind == "u":
+        return arr.astype(np.uint64)
+    return arr.astype(np.int64).view(np.uint64)
+
+def mix64(x: int) -> int:
+    """splitmix64's finalizer: a bijective 64-bit scramble of x in [0, 2^64)."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+def mix64_array(x: "np.ndarray") -> "np.ndarray":
+    """mix64 over a uint64 array; uint64 arithmetic already wraps mod 2^64."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+@contextlib.contextmanager
+def without_numpy(*modules: ModuleType) -> Iterator[None]:
+    """Force the plain-python paths here and in `modules` (benchmarks compare both)."""
+    saved = [(mod, mod.np) for mod in (*modules, sys.modules[__name__])]
+    for mod, _ in saved:
+        mod.np = None
+    try:
+        yield
+    finally:
+        for mod, numpy in saved:
+            mod.np = numpy
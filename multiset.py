@@ -0,0 +1,297 @@
+"""
+repo: dsa-grind
+
+purpose:
+- shared multiset (value -> how many times) kernel for the array comparison problems
+- GeeksForGeeks_Array_Subset and GeeksForGeeks_Check_Equal_Arrays both delegate here
+- counts are built in C: collections.Counter, or np.unique(return_counts=True) for int arrays
+- subset / equality / difference / intersection; lengths are compared before counting anything
+- constant-memory sketches (multiset hash, Count-Min) for arrays too big to count,
+  mergeable across shards, answering "definitely not" or "probably"
+"""
+
+from __future__ import annotations
+
+import math
+import hashlib
+import operator
+from array import array
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from kernels import MASK64, as_int_array, as_uint64_array, mix64, mix64_array, np
+
+INT64_MIN = -(1 << 63)
+
+class Multiset:
+    """
+    Counts of hashable values, backed by either a Counter or a pair of
+    numpy arrays (sorted distinct values, their counts) for integer input.
+    Both give the same answers; mixing the two falls back to Counter.
+    """
+
+    __slots__ = ("counter", "values", "counts", "size")
+
+    def __init__(self, values: Iterable = ()):
+        arr = as_int_array(values)
+        if arr is not None:
+            self.counter = None
+            self.values, self.counts = np.unique(arr, return_counts=True)
+            self.size = len(arr)
+        else:
+            self.counter = Counter(values)
+            self.values = self.counts = None
+            self.size = sum(self.counter.values())
+
+    @classmethod
+    def from_counter(cls, counter: Counter) -> "Multiset":
+        ms = cls.__new__(cls)
+        ms.counter = +counter  # drops zero and negative counts
+        ms.values = ms.counts = None
+        ms.size = sum(ms.counter.values())
+        return ms
+
+    @classmethod
+    def from_arrays(cls, values, counts) -> "Multiset":
+        keep = counts > 0
+        ms = cls.__new__(cls)
+        ms.counter = None
+        ms.values, ms.counts = values[keep], counts[keep]
+        ms.size = int(ms.counts.sum())
+        return ms
+
+    def _both_numpy(self, other: "Multiset") -> bool:
+        return self.counter is None and other.counter is None
+
+    def as_counter(self) -> Counter:
+        if self.counter is not None:
+            return self.counter
+        return Counter(dict(zip(self.values.tolist(), self.counts.tolist())))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Multiset):
+            return NotImplemented
+        if self.size != other.size:
+            return False
+        if self._both_numpy(other):
+            return np.array_equal(self.values, other.values) and np.array_equal(self.counts, other.counts)
+        return self.as_counter() == other.as_counter()
+
+    def issubset(self, other: "Multiset") -> bool:
+        """Every value shows up in other at least as many times as in self."""
+        if self.size > other.size:
+            return False
+        if self._both_numpy(other):
+            if not len(self.values):
+                return True
+            if not len(other.values):
+                return False
+            at = np.searchsorted(other.values, self.values)
+            at[at == len(other.values)] = 0  # off the end, can't match anyway
+            return bool((other.values[at] == self.values).all() and (other.counts[at] >= self.counts).all())
+        theirs = other.as_counter()
+        for value, count in self.as_counter().items():
+            if theirs.get(value, 0) < count:
+                return False
+        return True
+
+    def __le__(self, other: "Multiset") -> bool:
+        return self.issubset(other)
+
+    def __sub__(self, other: "Multiset") -> "Multiset":
+        """What's left of self after taking out other's values (never below zero)."""
+        if self._both_numpy(other):
+            counts = self.counts.copy()
+            _, ours, theirs = np.intersect1d(self.values, other.values, assume_unique=True, return_indices=True)
+            counts[ours] -= np.minimum(counts[ours], other.counts[theirs])
+            return Multiset.from_arrays(self.values, counts)
+        return Multiset.from_counter(self.as_counter() - other.as_counter())
+
+    def __and__(self, other: "Multiset") -> "Multiset":
+        """Values in both, each as many times as the smaller count."""
+        if self._both_numpy(other):
+            values, ours, theirs = np.intersect1d(self.values, other.values, assume_unique=True, return_indices=True)
+            return Multiset.from_arrays(values, np.minimum(self.counts[ours], other.counts[theirs]))
+        return Multiset.from_counter(self.as_counter() & other.as_counter())
+
+def _sized(values) -> Optional[int]:
+    try:
+        return len(values)
+    except TypeError:
+        return None
+
+def is_subset(sub: Iterable, sup: Iterable) -> bool:
+    """True if sub is a sub-multiset of sup. Checks lengths before counting anything."""
+    n, m = _sized(sub), _sized(sup)
+    if n is not None and m is not None and n > m:
+        return False
+    return Multiset(sub).issubset(Multiset(sup))
+
+def is_equal(a: Iterable, b: Iterable) -> bool:
+    """True if a and b hold the same values the same number of times, in any order."""
+    n, m = _sized(a), _sized(b)
+    if n is not None and m is not None and n != m:
+        return False
+    return Multiset(a) == Multiset(b)
+
+# --------------------------------------------------
+# Sketches
+# --------------------------------------------------
+
+def hash64(value, seed: int) -> int:
+    """
+    64-bit hash of a value that's the same in every process (unlike hash() on str).
+    Integers in [-2^63, 2^64) are mixed as value mod 2^64, which is exactly what
+    the numpy path sees for any int or uint array; integral floats hash as the
+    int they equal, like they count in a Counter. Anything else goes through
+    blake2b of its repr first.
+    """
+    if isinstance(value, float) or (np is not None and isinstance(value, np.floating)):
+        if float(value).is_integer():
+            value = int(value)
+    try:
+        value = operator.index(value)  # numpy integers hash like the int they are
+    except TypeError:
+        pass
+    else:
+        if INT64_MIN <= value <= MASK64:
+            return mix64((value & MASK64) ^ seed)
+    digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+    return mix64(int.from_bytes(digest, "little") ^ seed)
+
+def _hash64_array(arr: "np.ndarray", seed: int) -> "np.ndarray":
+    return mix64_array(as_uint64_array(arr) ^ np.uint64(seed))
+
+def _seeds(seed: int, n: int) -> List[int]:
+    return [mix64((seed + i + 1) & MASK64) for i in range(n)]
+
+class MultisetHash:
+    """
+    Order-independent hash of a multiset: the sum of per-value 64-bit hashes
+    mod 2^64, in `lanes` independently seeded copies. Two different multisets
+    collide with probability about 2^(-64 * lanes). Built in one pass with
+    constant memory; `+=` merges shards hashed with the same seed and lanes.
+    """
+
+    __slots__ = ("seeds", "sums", "size")
+
+    def __init__(self, values: Iterable = (), lanes: int = 2, seed: int = 0):
+        self.seeds = _seeds(seed, lanes)
+        self.sums = [0] * lanes
+        self.size = 0
+        self.update(values)
+
+    def update(self, values: Iterable) -> "MultisetHash":
+        arr = as_int_array(values)
+        if arr is not None:
+            for lane, seed in enumerate(self.seeds):
+                total = int(_hash64_array(arr, seed).sum(dtype=np.uint64))
+                self.sums[lane] = (self.sums[lane] + total) & MASK64
+            self.size += len(arr)
+            return self
+        for value in values:
+            for lane, seed in enumerate(self.seeds):
+                self.sums[lane] = (self.sums[lane] + hash64(value, seed)) & MASK64
+            self.size += 1
+        return self
+
+    def __iadd__(self, other: "MultisetHash") -> "MultisetHash":
+        if self.seeds != other.seeds:
+            raise ValueError("can only merge multiset hashes built with the same seed and lanes")
+        self.sums = [(a + b) & MASK64 for a, b in zip(self.sums, other.sums)]
+        self.size += other.size
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        """False means definitely not equal, True means probably equal."""
+        if not isinstance(other, MultisetHash):
+            return NotImplemented
+        if self.seeds != other.seeds:
+            raise ValueError("can only compare multiset hashes built with the same seed and lanes")
+        return self.size == other.size and self.sums == other.sums
+
+    __hash__ = None
+
+class CountMinSketch:
+    """
+    depth x width counters; each value adds its count to one counter per row.
+    With width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)), estimate()
+    overshoots a true count by more than epsilon * n with probability <= delta.
+    Every counter is a sum of non-negative counts, so if sub is a sub-multiset
+    of sup, each of sub's counters is <= sup's: one counter over means
+    definitely not a subset. `+=` merges shards with the same parameters.
+    """
+
+    __slots__ = ("width", "depth", "seeds", "rows", "size")
+
+    def __init__(self, values: Iterable = (), epsilon: float = 1e-3, delta: float = 1e-3, seed: int = 0):
+        self.width = max(1, math.ceil(math.e / epsilon))
+        self.depth = max(1, math.ceil(math.log(1 / delta)))
+        self.seeds = _seeds(seed, self.depth)
+        self.rows = [array("q", bytes(8 * self.width)) for _ in range(self.depth)]
+        self.size = 0
+        self.update(values)
+
+    def update(self, values: Iterable) -> "CountMinSketch":
+        arr = as_int_array(values)
+        if arr is not None:
+            for row, seed in zip(self.rows, self.seeds):
+                cells = (_hash64_array(arr, seed) % np.uint64(self.width)).astype(np.int64)
+                np.frombuffer(row, dtype=np.int64)[:] += np.bincount(cells, minlength=self.width)
+            self.size += len(arr)
+            return self
+        width = self.width
+        for value in values:
+            for row, seed in zip(self.rows, self.seeds):
+                row[hash64(value, seed) % width] += 1
+            self.size += 1
+        return self
+
+    def _check_compatible(self, other: "CountMinSketch") -> None:
+        if (self.width, self.seeds) != (other.width, other.seeds):
+            raise ValueError("sketches need the same epsilon, delta and seed")
+
+    def __iadd__(self, other: "CountMinSketch") -> "CountMinSketch":
+        self._check_compatible(other)
+        for ours, theirs in zip(self.rows, other.rows):
+            if np is not None:
+                np.frombuffer(ours, dtype=np.int64)[:] += np.frombuffer(theirs, dtype=np.int64)
+            else:
+                for i, count in enumerate(theirs):
+                    ours[i] += count
+        self.size += other.size
+        return self
+
+    def estimate(self, value) -> int:
+        """An upper bound on how many times value was added."""
+        return min(row[hash64(value, seed) % self.width] for row, seed in zip(self.rows, self.seeds))
+
+    def probably_subset_of(self, other: "CountMinSketch") -> bool:
+        """False means definitely not a subset, True means probably a subset."""
+        self._check_compatible(other)
+        if self.size > other.size:
+            return False
+        for ours, theirs in zip(self.rows, other.rows):
+            if np is not None:
+                if (np.frombuffer(ours, dtype=np.int64) > np.frombuffer(theirs, dtype=np.int64)).any():
+                    return False
+            elif any(a > b for a, b in zip(ours, theirs)):
+                return False
+        return True
+
+def probably_equal(a: Iterable, b: Iterable, lanes: int = 2, seed: int = 0) -> bool:
+    """False: a and b are definitely not the same multiset. True: they almost surely are."""
+    n, m = _sized(a), _sized(b)
+    if n is not None and m is not None and n != m:
+        return False
+    return MultisetHash(a, lanes, seed) == MultisetHash(b, lanes, seed)
+
+def probably_subset(sub: Iterable, sup: Iterable, epsilon: float = 1e-3, delta: float = 1e-3, seed: int = 0) -> bool:
+    """False: sub is definitely not a sub-multiset of sup. True: it probably is."""
+    n, m = _sized(sub), _sized(sup)
+    if n is not None and m is not None and n > m:
+        return False
+    return CountMinSketch(sub, epsilon, delta, seed).probably_subset_of(CountMinSketch(sup, epsilon, delta, seed))
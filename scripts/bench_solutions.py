@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+repo: dsa-grind
+
+purpose:
+- benchmark the batch / streaming variants added to solution files
+  against the original one-call-at-a-time methods
+- check both give the same answers on the same synthetic input first
+- report peak traced memory for the streaming variants
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import random
+import argparse
+import contextlib
+import tempfile
+import tracemalloc
+import importlib.util
+from array import array
+from collections import Counter
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_stats import best_of  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))  # solution files import shared modules like kernels.py
+
+import kernels  # noqa: E402
+
+def load_solution(filename: str) -> ModuleType:
+    """Import a solution file from the repo root by filename."""
+    path = REPO_ROOT / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def report(rows: list, baseline: str) -> None:
+    base = dict(rows)[baseline]
+    for name, seconds in rows:
+        print(f"   {name:<28} {seconds * 1000:9.1f} ms  ({base / seconds:6.2f}x)")
+
+def timed_peak(fn: Callable[[], object]) -> tuple:
+    """Run fn once under tracemalloc; return (result, seconds, peak MB)."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+# --------------------------------------------------
+# Benchmarks
+# --------------------------------------------------
+
+def bench_two_sum(args: argparse.Namespace) -> None:
+    mod = load_solution("LeetCode_Two_Sum.py")
+    rng = random.Random(args.seed)
+    # sparse values, so a random target almost never has a pair
+    nums = [rng.randint(-10**9, 10**9) for _ in range(args.size)]
+    targets = []
+    for _ in range(args.targets):
+        if rng.random() < args.hit_rate:
+            i, j = rng.sample(range(args.size), 2)
+            targets.append(nums[i] + nums[j])
+        else:
+            targets.append(rng.randint(-2 * 10**9, 2 * 10**9))
+
+    solution = mod.Solution()
+    expected = [solution.two_sum(nums, t) for t in targets]
+    index = mod.TwoSumIndex(nums)
+    if index.query_many(targets) != expected:
+        raise SystemExit("❌ two_sum_batch disagrees with two_sum")
+    if [index.query(t) for t in targets] != expected:
+        raise SystemExit("❌ dict index disagrees with two_sum")
+
+    rows = [
+        ("two_sum() in a loop", best_of(lambda: [solution.two_sum(nums, t) for t in targets], args.repeat)),
+        ("TwoSumIndex, dict path", best_of(lambda: [index.query(t) for t in targets], args.repeat)),
+    ]
+    if mod.np is not None and args.size >= mod.NUMPY_MIN_SIZE:
+        rows.append(("TwoSumIndex, numpy path", best_of(lambda: index.query_many(targets), args.repeat)))
+    rows.append(("two_sum_batch (incl. build)", best_of(lambda: solution.two_sum_batch(nums, targets), args.repeat)))
+
+    print(f"🎯 {args.size} nums, {args.targets} targets ({args.hit_rate:.0%} with a pair), best of {args.repeat}")
+    report(rows, "two_sum() in a loop")
+
+def bench_contains_duplicate(args: argparse.Namespace) -> None:
+    mod = load_solution("LeetCode_Contains_Duplicate.py")
+    rng = random.Random(args.seed)
+    # distinct 63-bit ids, then one repeat near the end so nobody exits early
+    nums = rng.sample(range(2**62), args.size)
+    dup_at = int(args.size * args.dup_at)
+    nums[dup_at] = nums[dup_at // 2]
+
+    def ids():
+        # a one-shot stream, like reading event ids off a socket
+        return (value for value in nums)
+
+    variants = [
+        ("contains_duplicate()", lambda: (mod.Solution().contains_duplicate(nums), None)),
+        ("bloom, list", lambda: (None, mod.find_first_duplicate(nums, expected_items=args.size))),
+        ("bloom, one-shot stream", lambda: (None, mod.find_first_duplicate(ids(), expected_items=args.size))),
+        ("sort-merge, one-shot stream", lambda: (None, mod.find_first_duplicate(
+            ids(), max_candidates=0, run_size=args.run_size))),
+    ]
+    if mod.np is not None:
+        packed = array("q", nums)
+
+        def python_bloom():
+            with kernels.without_numpy(mod):
+                return None, mod.find_first_duplicate(ids(), expected_items=args.size)
+
+        variants.append(("bloom, stream, no numpy", python_bloom))
+        variants.append(("numpy sort, array('q')", lambda: (mod.has_duplicates(packed), None)))
+        variants.append(("find_duplicates, array('q')", lambda: (bool(mod.find_duplicates(packed)), None)))
+    print(f"🔁 {args.size} ids, first repeat at {dup_at}")
+    print(f"   {'variant':<28} {'time':>9}     {'ids/s':>10}  {'peak':>9}")
+    for name, fn in variants:
+        (found, first), seconds, peak = timed_peak(fn)
+        if found is False or (first is not None and first != (dup_at, nums[dup_at])):
+            raise SystemExit(f"❌ {name} got the wrong answer")
+        print(f"   {name:<28} {seconds * 1000:9.1f} ms  {args.size / seconds:10.0f}  {peak:6.1f} MB")
+
+def bench_majority(args: argparse.Namespace) -> None:
+    mod = load_solution("LeetCode_Majority_Element.py")
+    sys.modules[mod.__name__] = mod # so pool workers can unpickle its functions
+    rng = random.Random(args.seed)
+    # a bare majority hiding in random noise
+    nums = [7] * (args.size // 2 + 1) + [rng.randint(0, 10**6) for _ in range(args.size - args.size // 2 - 1)]
+    rng.shuffle(nums)
+    sevens = Counter(nums)[7] # the noise can draw 7 too
+    jobs = args.jobs or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ids.bin"
+        path.write_bytes(array("q", nums).tobytes())
+        solution = mod.Solution()
+        variants = [
+            ("majority_element()", lambda: solution.majority_element(nums)),
+            ("majority_parallel, 1 job", lambda: mod.majority_parallel(nums, jobs=1)),
+            (f"majority_parallel, {jobs} jobs", lambda: mod.majority_parallel(nums, jobs=jobs)),
+            (f"same, int64 file, {jobs} jobs", lambda: mod.majority_parallel(str(path), jobs=jobs)),
+            (f"heavy hitters k={args.k}, {jobs} jobs", lambda: mod.heavy_hitters_parallel(str(path), args.k, jobs=jobs)),
+        ]
+        rows = []
+        for name, fn in variants:
+            result = fn()
+            if result != 7 and result != {7: sevens}:
+                raise SystemExit(f"❌ {name} got {result!r}")
+            rows.append((name, best_of(fn, args.repeat)))
+
+    print(f"🗳️  {args.size} nums, majority verified, best of {args.repeat}")
+    report(rows, "majority_element()")
+
+def bench_missing_number(args: argparse.Namespace) -> None:
+    mod = load_solution("LeetCode_Missing_Number.py")
+    rng = random.Random(args.seed)
+    ids = array("q", range(args.size + args.k))
+    missing = sorted(rng.sample(range(len(ids)), args.k))
+    for gap in reversed(missing):
+        del ids[gap]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ids.bin"
+        path.write_bytes(ids.tobytes())
+        solution = mod.Solution()
+        nums = ids.tolist()
+        timed = []
+        variants = [(f"bitmap k={args.k}, mmap file", lambda: solution.missing_numbers(str(path), args.k))]
+        if args.k == 1:
+            timed.append(("missing_number(), list", best_of(lambda: solution.missing_number(nums), args.repeat)))
+            variants.insert(0, ("stream, mmap file", lambda: [mod.missing_number_stream(str(path))]))
+
+        backends = [("numpy", contextlib.nullcontext)] if mod.np is not None else []
+        backends.append(("python", lambda: kernels.without_numpy(mod)))
+        for backend, context in backends:
+            with context():
+                for name, fn in variants:
+                    if fn() != missing:
+                        raise SystemExit(f"❌ {name} ({backend}) got the wrong answer")
+                    timed.append((f"{name} ({backend})", best_of(fn, args.repeat)))
+
+    print(f"🕳️  {args.size} ids, {args.k} missing, best of {args.repeat}")
+    report(timed, timed[0][0])
+
+def bench_gaps(args: argparse.Namespace) -> None:
+    mod = load_solution("LeetCode_Missing_Number.py")
+    rng = random.Random(args.seed)
+    # clumps of consecutive ids scattered over a wide range, like real sequences
+    ids = array("q")
+    for _ in range(args.clumps):
+        start = rng.randrange(args.width)
+        ids.extend(range(start, start + rng.randint(1, 2 * args.size // args.clumps)))
+
+    shards = [mod.RoaringBitmap() for _ in range(args.shards)]
+    start = time.perf_counter()
+    step = len(ids) // args.shards + 1
+    for i, shard in enumerate(shards):
+        mod.missing_ranges(ids[i * step:(i + 1) * step], bitmap=shard)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    merged = mod.RoaringBitmap()
+    for shard in shards:
+        merged |= shard
+    joined = time.perf_counter() - start
+    start = time.perf_counter()
+    gaps = merged.missing_ranges(0, args.width)
+    walked = time.perf_counter() - start
+
+    print(f"🧱 {len(ids)} ids in {args.clumps} clumps over [0, {args.width}], {args.shards} shards")
+    print(f"   build {built * 1000:9.1f} ms   merge {joined * 1000:7.1f} ms   gaps {walked * 1000:7.1f} ms ({len(gaps)} ranges)")
+    print(f"   roaring {merged.nbytes() / 1024 / 1024:8.2f} MB vs. flat bitmap {args.width / 8 / 1024 / 1024:8.2f} MB")
+
+def legacy_check_equal(a: list, b: list) -> bool:
+    """checkEqual() before it moved to multiset.py, a dict update per element."""
+    a_dict = {}
+    for num in a:
+        a_dict[num] = a_dict.get(num, 0) + 1
+    for num in b:
+        if num not in a_dict:
+            return False
+        a_dict[num] -= 1
+        if a_dict[num] == 0:
+            del a_dict[num]
+    return not a_dict
+
+def bench_multiset(args: argparse.Namespace) -> None:
+    subset_mod = load_solution("GeeksForGeeks_Array_Subset.py")
+    equal_mod = load_solution("GeeksForGeeks_Check_Equal_Arrays.py")
+    import multiset
+    rng = random.Random(args.seed)
+    # two inventory snapshots: same skus, shuffled, one count nudged at the very end
+    a = [rng.randrange(args.skus) for _ in range(args.size)]
+    b = a[:]
+    rng.shuffle(b)
+    b[-1] = a[-1] if rng.random() < 0.5 else args.skus
+
+    expected = legacy_check_equal(a, b)
+    solution = equal_mod.Solution()
+    if solution.checkEqual(a, b) != expected or subset_mod.Solution().isSubset(a, b) != expected:
+        raise SystemExit("❌ multiset kernel disagrees with the dict loop")
+
+    rows = [
+        ("dict loop (old checkEqual)", best_of(lambda: legacy_check_equal(a, b), args.repeat)),
+        ("checkEqual(), lists", best_of(lambda: solution.checkEqual(a, b), args.repeat)),
+    ]
+    if multiset.np is not None:
+        a_arr, b_arr = multiset.np.array(a), multiset.np.array(b)
+        rows.append(("checkEqual(), ndarrays", best_of(lambda: solution.checkEqual(a_arr, b_arr), args.repeat)))
+        if solution.checkEqualApprox(a_arr, b_arr) != expected:
+            raise SystemExit("❌ multiset hash disagrees with the dict loop")
+        rows.append(("checkEqualApprox(), ndarrays", best_of(lambda: solution.checkEqualApprox(a_arr, b_arr), args.repeat)))
+        subset = subset_mod.Solution()
+        rows.append(("isSubsetApprox(), ndarrays", best_of(lambda: subset.isSubsetApprox(a_arr, b_arr), args.repeat)))
+        with kernels.without_numpy(multiset):
+            rows.append(("checkEqual(), Counter only", best_of(lambda: solution.checkEqual(a, b), args.repeat)))
+            python_hash = multiset.MultisetHash(a_arr.tolist())
+        # both backends have to land on the same sums, including uint64 past 2^63
+        wide = multiset.np.array([0, 2**63, 2**64 - 1, rng.getrandbits(64)], dtype=multiset.np.uint64)
+        with kernels.without_numpy(multiset):
+            python_wide = multiset.MultisetHash(wide.tolist())
+        if multiset.MultisetHash(a_arr) != python_hash or multiset.MultisetHash(wide) != python_wide:
+            raise SystemExit("❌ numpy and python multiset hashes disagree")
+
+    print(f"📦 {args.size} skus per snapshot ({args.skus} distinct), equal={expected}, best of {args.repeat}")
+    report(rows, "dict loop (old checkEqual)")
+
+def bench_union(args: argparse.Namespace) -> None:
+    mod = load_solution("GeeksForGeeks_Union_Of_Array_With_Duplicates.py")
+    rng = random.Random(args.seed)
+    runs = [sorted(rng.randrange(args.size * 2) for _ in range(args.size)) for _ in range(args.k)]
+    a, b = runs[0], runs[1]
+    solution = mod.Solution()
+    expected = sorted(set(a) | set(b))
+    if solution.findUnion(a, b) != expected:
+        raise SystemExit("❌ two pointer union disagrees with the set union")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, run in enumerate(runs):
+            paths.append(Path(tmp) / f"run{i}.txt")
+            paths[-1].write_text("".join(f"{value}\n" for value in run))
+
+        def union_files():
+            files = [open(path) for path in paths]
+            try:
+                with open(Path(tmp) / "union.txt", "w") as out:
+                    return mod.write_union(out, *(mod.iter_file(f) for f in files))
+            finally:
+                for f in files:
+                    f.close()
+
+        rows = [
+            ("set union, 2 lists", best_of(lambda: list(set(a).union(set(b))), args.repeat)),
+            ("findUnion(), 2 sorted lists", best_of(lambda: solution.findUnion(a, b), args.repeat)),
+            (f"findUnionStream(), {args.k} lists", best_of(lambda: sum(1 for _ in solution.findUnionStream(*runs)), args.repeat)),
+            (f"write_union(), {args.k} files", best_of(union_files, args.repeat)),
+        ]
+
+    print(f"🔗 {args.k} sorted runs of {args.size}, best of {args.repeat}")
+    report(rows, "set union, 2 lists")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark solution-file kernels.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("two-sum", help="TwoSumIndex / two_sum_batch vs. two_sum() per target")
+    p.add_argument("--size", type=int, default=20000)
+    p.add_argument("--targets", type=int, default=1000)
+    p.add_argument("--hit-rate", type=float, default=0.5, help="share of targets that have a pair")
+    p.set_defaults(func=bench_two_sum)
+
+    p = sub.add_parser("contains-duplicate", help="streaming find_first_duplicate vs. contains_duplicate()")
+    p.add_argument("--size", type=int, default=200000)
+    p.add_argument("--dup-at", type=float, default=0.9, help="where the repeat sits, as a share of --size")
+    p.add_argument("--run-size", type=int, default=1 << 16, help="sort-merge run length")
+    p.set_defaults(func=bench_contains_duplicate)
+
+    p = sub.add_parser("majority", help="parallel Boyer-Moore / Misra-Gries vs. majority_element()")
+    p.add_argument("--size", type=int, default=2000000)
+    p.add_argument("--jobs", type=int, default=0, help="worker processes (default: all cores)")
+    p.add_argument("-k", type=int, default=3, help="heavy hitter threshold, > n / k")
+    p.set_defaults(func=bench_majority)
+
+    p = sub.add_parser("missing-number", help="mmap / block-reduced missing_number_stream vs. missing_number()")
+    p.add_argument("--size", type=int, default=5000000)
+    p.add_argument("-k", type=int, default=1, help="how many ids are missing")
+    p.set_defaults(func=bench_missing_number)
+
+    p = sub.add_parser("gaps", help="RoaringBitmap shard build / merge / missing_ranges")
+    p.add_argument("--size", type=int, default=2000000, help="roughly how many ids")
+    p.add_argument("--width", type=int, default=2**40, help="id range")
+    p.add_argument("--clumps", type=int, default=2000)
+    p.add_argument("--shards", type=int, default=4)
+    p.set_defaults(func=bench_gaps)
+
+    p = sub.add_parser("multiset", help="shared multiset kernel vs. the hand-rolled frequency dict")
+    p.add_argument("--size", type=int, default=1000000)
+    p.add_argument("--skus", type=int, default=100000, help="distinct values")
+    p.set_defaults(func=bench_multiset)
+
+    p = sub.add_parser("union", help="two pointer / k-way sorted union vs. set union")
+    p.add_argument("--size", type=int, default=500000, help="values per sorted run")
+    p.add_argument("-k", type=int, default=4, help="how many sorted runs")
+    p.set_defaults(func=bench_union)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+repo: dsa-grind
+
+purpose:
+- benchmark the stats pipeline in scripts/grind_stats.py
+- generate synthetic repos (TEMPLATE.py-shaped solutions + .cph files)
+- time each pipeline stage and report throughput and peak RSS as JSON
+- compare the header-only parser against the old full-file regex parser
+- measure cold-start latency of the scripts/ entry points (-X importtime)
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import platform
+import tempfile
+import subprocess
+import contextlib
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import grind_files  # noqa: E402
+import grind_stats as stats  # noqa: E402
+
+# --------------------------------------------------
+# Synthetic Corpus
+# --------------------------------------------------
+
+HEADER = '''"""
+time_spent: {mins} mins
+difficulty: {difficulty}
+topic: {topic}
+problem_link: https://leetcode.com/problems/problem-{i}/
+tries: {tries}
+created: 2026-01-{day:02d}
+
+notes:
+{notes}
+"""
+
+class Solution:
+    def solve(self, nums):
+{body}
+'''
+
+def write_corpus(root: Path, n: int, notes_lines: int = 40, body_lines: int = 60, seed: int = 0) -> List[Path]:
+    rng = random.Random(seed)
+    paths = []
+    for i in range(n):
+        path = root / f"LeetCode_Problem_{i}.py"
+        path.write_text(HEADER.format(
+            i=i,
+            mins=rng.randint(1, 90),
+            difficulty=rng.choice(["easy", "medium", "hard"]),
+            topic=", ".join(rng.sample(["arrays", "hashing", "math", "graphs", "dp"], 2)),
+            tries=rng.randint(1, 4),
+            day=rng.randint(1, 28),
+            notes="\n".join(f"- thinking out loud, line {j}" for j in range(notes_lines)),
+            body="\n".join(f"        x_{j} = nums[{j}] if len(nums) > {j} else 0" for j in range(body_lines)),
+        ), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+PLATFORMS = list(stats.PLATFORM_MAP)
+TOPICS = ["arrays", "hashing", "math", "graphs", "dp", "strings", "two pointers",
+          "sliding window", "trees", "heaps", "sorting", "binary search"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+def write_synthetic_repo(root: Path, n: int, seed: int = 0) -> None:
+    """
+    Lay out a repo the way grind_stats.py expects: solutions rendered from
+    TEMPLATE.py into per-platform folders, a matching .cph/*.prob per file
+    (with absolute file: urls, so normalization has work to do) and a
+    README with placeholders. load_config() writes the default config.
+    """
+    rng = random.Random(seed)
+    template = (stats.REPO_ROOT / "TEMPLATE.py").read_text(encoding="utf-8")
+    header_end = template.index('"""', 3)
+    header, rest = template[:header_end], template[header_end:]
+    cph_dir = root / ".cph"
+    cph_dir.mkdir(parents=True, exist_ok=True)
+    start = date(2025, 1, 1)
+
+    for i in range(n):
+        plat = rng.choice(PLATFORMS)
+        folder = root / plat.lower()
+        folder.mkdir(exist_ok=True)
+        name = f"{plat}_Synthetic_Problem_{i}.py"
+        created = start + timedelta(days=rng.randint(0, 600))
+        filled = (
+            header.replace("{problem_link}", f"https://example.com/problems/{i}/")
+            .replace("{created}", created.isoformat())
+            .replace("time_spent: ?", f"time_spent: {rng.randint(1, 120)} mins")
+            .replace("difficulty: ?", f"difficulty: {rng.choice(DIFFICULTIES)}")
+            .replace("topic: ?", "topic: " + ", ".join(rng.sample(TOPICS, rng.randint(1, 3))))
+            .replace("tries: 1", f"tries: {rng.randint(1, 5)}")
+        )
+        (folder / name).write_text(filled + rest, encoding="utf-8")
+
+        digest = hashlib.md5(name.encode("utf-8")).hexdigest()
+        src = (folder / name).as_uri()
+        (cph_dir / f".{name}_{digest}.prob").write_text(json.dumps({
+            "name": f"Local: {name[:-3]}", "url": src, "tests": [], "interactive": False,
+            "memoryLimit": 1024, "timeLimit": 3000, "srcPath": src, "group": "local", "local": True,
+        }, separators=(",", ":")), encoding="utf-8")
+
+    (root / "README.md").write_text(
+        "<!-- GRIND_BADGES -->\n\n<!-- GRIND_STATS_TABLE -->\n\n<!-- GRIND_TOPICS -->\n\n"
+        "_last updated: <!-- GRIND_TIMESTAMP -->_\n",
+        encoding="utf-8",
+    )
+
+def point_pipeline_at(root: Path) -> None:
+    """Repoint grind_stats' module-level paths at a synthetic repo."""
+    stats.REPO_ROOT = root
+    stats.README = root / "README.md"
+    stats.CONFIG_FILE = root / "config" / "grind.json"
+    stats.CACHE_FILE = root / "config" / "grind.cache.json"
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0.0 where it can't be read)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return windows_peak_rss_mb()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def windows_peak_rss_mb() -> float:
+    import ctypes
+    from ctypes import wintypes
+
+    class Counters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    try:
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return 0.0
+    except (AttributeError, OSError):
+        return 0.0
+    return counters.PeakWorkingSetSize / (1024 * 1024)
+
+# --------------------------------------------------
+# Baseline Parser
+# --------------------------------------------------
+
+def legacy_parse_file(path: Path) -> Optional[stats.Problem]:
+    """The original parser: whole-file read, DOTALL docstring, one regex per key."""
+    m = stats.FILE_RE.match(path.name)
+    if not m:
+        return None
+
+    platform = stats.PLATFORM_MAP.get(m.group("platform"), "unknown")
+    content = path.read_text(encoding="utf-8")
+    docstring_match = re.search(r'"""(.*?)"""', content, re.DOTALL)
+    metadata_text = docstring_match.group(1) if docstring_match else ""
+
+    def get_val(key: str, default="?") -> str:
+        m = re.search(rf"^\s*{key}:\s*(.+)$", metadata_text, re.MULTILINE | re.IGNORECASE)
+        return m.group(1).strip() if m else default
+
+    time_str = get_val("time_spent", "?")
+    tries_str = get_val("tries", "1")
+    tries = int(re.search(r'\d+', tries_str).group()) if re.search(r'\d+', tries_str) else 1
+    created_str = get_val("created", "?")
+    created_date = None
+    if created_str and "?" not in created_str:
+        try:
+            created_date = datetime.strptime(created_str, "%Y-%m-%d").date()
+        except ValueError:
+            pass
+
+    return stats.Problem(
+        filename=path.name,
+        platform=platform,
+        difficulty=get_val("difficulty", "Unknown"),
+        time_spent_str=time_str,
+        time_spent_mins=stats.parse_time(time_str),
+        created=created_date,
+        tries=tries,
+        topic=get_val("topic", "misc"),
+        url=get_val("problem_link", "#"),
+    )
+
+# --------------------------------------------------
+# Benchmarks
+# --------------------------------------------------
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Fastest of `repeat` runs of fn, in seconds (shared with bench_solutions.py)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_parser(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(Path(tmp), args.files)
+
+        new = [stats.parse_file(p) for p in paths]
+        old = [legacy_parse_file(p) for p in paths]
+        if new != old:
+            raise SystemExit("❌ parsers disagree on the synthetic corpus")
+
+        t_old = best_of(lambda: [legacy_parse_file(p) for p in paths], args.repeat)
+        t_new = best_of(lambda: [stats.parse_file(p) for p in paths], args.repeat)
+
+    print(f"📄 {args.files} files, best of {args.repeat}")
+    print(f"   legacy parser: {t_old * 1000:8.1f} ms ({args.files / t_old:,.0f} files/s)")
+    print(f"   header parser: {t_new * 1000:8.1f} ms ({args.files / t_new:,.0f} files/s)")
+    print(f"   speedup:       {t_old / t_new:8.2f}x")
+
+def run_stages(n: int, jobs: int) -> Dict[str, dict]:
+    """
+    Build an n-file repo and time every pipeline stage in this process.
+    peak_rss_mb is the process high-water mark after each stage.
+    """
+    results: Dict[str, dict] = {}
+
+    def stage(name: str, fn: Callable[[], object], items: int = n) -> object:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            out = fn()
+            elapsed = time.perf_counter() - start
+        results[name] = {
+            "seconds": round(elapsed, 4),
+            "items_per_sec": round(items / elapsed, 1) if elapsed else None,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+        return out
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        stage("generate", lambda: write_synthetic_repo(root, n))
+        point_pipeline_at(root)
+        config = stats.load_config()
+
+        paths = [Path(e.path) for e, _ in stats.iter_solution_files(root)]
+        stage("discover", lambda: sum(1 for _ in stats.iter_solution_files(root)))
+        stage("parse_file", lambda: [stats.parse_file(p) for p in paths])
+        stage("scan_cold", lambda: stats.scan_problems(None))
+        # what a first real run does: every file misses, and is parsed and hashed for the cache
+        stage("scan_cold_cache_fill", lambda: stats.scan_problems(stats.load_cache()))
+        if jobs > 1:
+            stage(f"scan_cold_jobs_{jobs}", lambda: stats.scan_problems(None, jobs=jobs))
+            stage(f"scan_cold_cache_fill_jobs_{jobs}", lambda: stats.scan_problems(stats.load_cache(), jobs=jobs))
+
+        cache = stats.load_cache()
+        stats.scan_problems(cache)
+        stats.save_cache(cache)
+
+        def warm():
+            c = stats.load_cache()
+            store = stats.scan_problems(c)
+            stats.save_cache(c)
+            return store, c
+        problems, cache = stage("scan_warm_cached", warm)
+        stage("check_manifest", lambda: grind_files.tree_manifest(root))
+
+        prob_count = len(list((root / ".cph").glob("*.prob")))
+        stage("normalize_cph", lambda: stats.normalize_cph_paths(problems, cache), prob_count)
+        stage("normalize_cph_noop", lambda: stats.normalize_cph_paths(problems, cache), prob_count)
+        stage("normalize_cph_uncached", lambda: stats.normalize_cph_paths(problems), prob_count)
+
+        activity = stats.ActivityIndex.from_dict(cache["activity"])
+        agg = stage("aggregate", lambda: stats.StatsAggregate.from_problems(problems, activity))
+        stage("update_readme", lambda: stats.update_readme(agg, config))
+        stage("update_readme_unchanged", lambda: stats.update_readme(agg, config))
+
+    return results
+
+def bench_pipeline(args: argparse.Namespace) -> None:
+    # every size runs in a fresh interpreter so peak RSS isn't inherited
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "jobs": args.jobs,
+        "results": [],
+    }
+    for n in args.sizes:
+        print(f"⏱️  {n} files...", file=sys.stderr)
+        out = subprocess.run(
+            [sys.executable, __file__, "stages", "--files", str(n), "--jobs", str(args.jobs)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        report["results"].append({"files": n, "stages": json.loads(out)})
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+        print(f"💾 Saved to {args.out}", file=sys.stderr)
+    else:
+        print(text)
+
+def bench_stages(args: argparse.Namespace) -> None:
+    print(json.dumps(run_stages(args.files, args.jobs)))
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# what git hooks actually run; the baseline is the bare interpreter and the
+# "as __main__" row is the old layout (whole module compiled from source)
+STARTUP_COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "update_stats.py --check": [str(SCRIPTS_DIR / "update_stats.py"), "--check"],
+    "update_stats.py --help": [str(SCRIPTS_DIR / "update_stats.py"), "--help"],
+    "grind_stats.py --help (as __main__)": [str(SCRIPTS_DIR / "grind_stats.py"), "--help"],
+    "new_problem.py (usage)": [str(SCRIPTS_DIR / "new_problem.py")],
+}
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def startup_env() -> Dict[str, str]:
+    # bytecode has to be writable or every run pays for compiling grind_stats
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def run_startup(argv: List[str], env: Dict[str, str], repeat: int) -> float:
+    cmd = [sys.executable] + argv
+    return best_of(lambda: subprocess.run(cmd, env=env, capture_output=True), repeat)
+
+def import_profile(argv: List[str], env: Dict[str, str], top: int) -> List[dict]:
+    """Top-level imports by cumulative time, from python -X importtime."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime"] + argv,
+        env=env, capture_output=True, text=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m and len(m.group(3)) == 1:
+            rows.append({"module": m.group(4), "self_us": int(m.group(1)), "cumulative_us": int(m.group(2))})
+    rows.sort(key=lambda r: r["cumulative_us"], reverse=True)
+    return rows[:top]
+
+def bench_startup(args: argparse.Namespace) -> None:
+    env = startup_env()
+    for argv in STARTUP_COMMANDS.values():
+        subprocess.run([sys.executable] + argv, env=env, capture_output=True)  # warm __pycache__
+
+    report = {"python": platform.python_version(), "repeat": args.repeat, "commands": {}}
+    for name, argv in STARTUP_COMMANDS.items():
+        report["commands"][name] = {
+            "best_ms": round(run_startup(argv, env, args.repeat) * 1000, 1),
+            "imports": import_profile(argv, env, args.top),
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    base = report["commands"]["python -c pass"]["best_ms"]
+    print(f"🚀 best of {args.repeat} (bare interpreter: {base:.1f} ms)")
+    for name, row in report["commands"].items():
+        print(f"   {name:<38} {row['best_ms']:7.1f} ms  (+{row['best_ms'] - base:.1f})")
+    print("📦 slowest imports for update_stats.py --check:")
+    for imp in report["commands"]["update_stats.py --check"]["imports"]:
+        print(f"   {imp['module']:<38} {imp['cumulative_us'] / 1000:7.1f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the stats pipeline.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("pipeline", help="time every stage on synthetic repos, JSON report")
+    p.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    p.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--out", help="write the JSON report here instead of stdout")
+    p.set_defaults(func=bench_pipeline)
+
+    p = sub.add_parser("stages", help="(internal) one size, in this process")
+    p.add_argument("--files", type=int, required=True)
+    p.add_argument("--jobs", type=int, default=1)
+    p.set_defaults(func=bench_stages)
+
+    p = sub.add_parser("parser", help="header parser vs. legacy full-file parser")
+    p.add_argument("--files", type=int, default=2000)
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_parser)
+
+    p = sub.add_parser("startup", help="cold-start latency of the scripts/ entry points")
+    p.add_argument("--repeat", type=int, default=20)
+    p.add_argument("--top", type=int, default=10, help="how many imports to list")
+    p.add_argument("--json", action="store_true", help="print the raw report as JSON")
+    p.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+repo: dsa-grind
+
+purpose:
+- find solution files (shared by the full stats run and --check)
+- fingerprint the solution tree (paths, sizes, mtimes) into a small manifest
+- answer `update_stats.py --check` without parsing or rendering anything
+- git hooks import this on every commit: only os, re, json and zlib here
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import json
+import zlib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Iterator, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_FILE = os.path.join(REPO_ROOT, "config", "grind.json")
+
+PLATFORM_MAP = {
+    "GeeksForGeeks": "geeksforgeeks",
+    "LeetCode": "leetcode",
+    "HackerRank": "hackerrank",
+    "Codeforces": "codeforces",
+}
+
+ALLOWED_EXTS = ("py", "js", "ts", "cpp", "java", "go", "rs")
+
+# File pattern: PlatformName_Anything.ext
+FILE_RE = re.compile(
+    rf"^(?P<platform>{'|'.join(map(re.escape, PLATFORM_MAP.keys()))})_.+\.({'|'.join(ALLOWED_EXTS)})$"
+)
+
+# --------------------------------------------------
+# Discovery
+# --------------------------------------------------
+
+# Always pruned, on top of hidden entries and grind.json's scan.ignore
+DEFAULT_IGNORE = (".git", ".cph", "node_modules")
+
+def ignore_matcher(patterns: Iterable[str]) -> Callable[[str, str], bool]:
+    """
+    Build a (name, rel_path) -> bool check.
+    Plain names match any entry with that name; glob patterns (*, ?, [])
+    or paths with a slash match the name or the repo-relative path.
+    """
+    names = set(DEFAULT_IGNORE)
+    globs = []
+    for pat in patterns:
+        pat = pat.strip().strip("/")
+        if not pat:
+            continue
+        if any(c in pat for c in "*?[/"):
+            import fnmatch
+
+            globs.append(fnmatch.translate(pat))
+        else:
+            names.add(pat)
+    glob_re = re.compile("|".join(globs)) if globs else None
+
+    def ignored(name: str, rel: str) -> bool:
+        if name in names:
+            return True
+        return bool(glob_re and (glob_re.match(name) or glob_re.match(rel)))
+
+    return ignored
+
+def iter_solution_files(root: str | os.PathLike, ignore: Iterable[str] = ()) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Walk root with os.scandir, yielding (entry, relative posix path) per solution file.
+    Hidden and ignored directories are pruned and names are checked
+    against FILE_RE before anything is stat'ed. Callers can use
+    entry.stat(), which caches the result on the entry.
+    """
+    ignored = ignore_matcher(ignore)
+    match_name = FILE_RE.match
+    stack = [(os.fspath(root), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        subdirs = []
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                rel = prefix + name
+                if entry.is_dir(follow_symlinks=False):
+                    if not ignored(name, rel):
+                        subdirs.append((entry.path, rel + "/"))
+                elif match_name(name) and entry.is_file() and not ignored(name, rel):
+                    yield entry, rel
+        # depth-first, in scandir order
+        stack.extend(reversed(subdirs))
+
+def solution_path_matcher(ignore: Iterable[str] = ()) -> Callable[[str], bool]:
+    """
+    Path-based version of iter_solution_files' filter, for repo-relative
+    posix paths that come from somewhere other than a walk (e.g. git).
+    """
+    ignored = ignore_matcher(ignore)
+
+    def is_solution(rel: str) -> bool:
+        *dirs, name = rel.split("/")
+        prefix = ""
+        for part in dirs:
+            prefix += part
+            if part.startswith(".") or ignored(part, prefix):
+                return False
+            prefix += "/"
+        return not name.startswith(".") and bool(FILE_RE.match(name)) and not ignored(name, rel)
+
+    return is_solution
+
+# --------------------------------------------------
+# Manifest
+# --------------------------------------------------
+
+def build_manifest(rows: Iterable[Tuple[str, int, int]]) -> dict:
+    """
+    Manifest of (rel_path, size, mtime_ns) rows: file count plus a CRC-32
+    over the sorted rows. It only has to notice that something moved, and
+    zlib loads in a fraction of the time hashlib does.
+    """
+    crc = 0
+    count = 0
+    for rel, size, mtime_ns in sorted(rows):
+        crc = zlib.crc32(f"{rel}\0{size}\0{mtime_ns}\n".encode("utf-8"), crc)
+        count += 1
+    return {"files": count, "crc32": f"{crc:08x}"}
+
+def tree_manifest(root: str | os.PathLike, ignore: Iterable[str] = ()) -> dict:
+    """Stat every solution file under root (no reads) and build its manifest."""
+    rows = []
+    for entry, rel in iter_solution_files(root, ignore):
+        st = entry.stat()
+        rows.append((rel, st.st_size, st.st_mtime_ns))
+    return build_manifest(rows)
+
+def is_stale(config: dict, root: str | os.PathLike = REPO_ROOT) -> bool:
+    """True if the solution tree no longer matches grind.json's manifest."""
+    recorded = config.get("optimization", {}).get("manifest")
+    if not recorded:
+        return True
+    ignore = config.get("scan", {}).get("ignore", [])
+    return tree_manifest(root, ignore) != recorded
+
+def check(root: str | os.PathLike = REPO_ROOT, config_file: str | os.PathLike = CONFIG_FILE) -> int:
+    """
+    Exit status for --check: 0 when the README stats are current, 1 when
+    update_stats.py needs to run. Nothing is parsed, rendered or written.
+    """
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        print("📝 No readable grind.json, stats need a full run")
+        return 1
+    if is_stale(config, root):
+        print("📝 Solution files changed since the last stats run")
+        return 1
+    print("✨ Stats are up to date")
+    return 0
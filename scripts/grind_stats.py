@@ -0,0 +1,1588 @@
+"""
+repo: dsa-grind
+
+purpose:
+- everything behind scripts/update_stats.py (scan, parse, aggregate, render)
+- lives in an importable module so its bytecode is cached in __pycache__;
+  the entry script itself is recompiled from source on every run
+- heavy or rarely needed imports and regexes are deferred until first use
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import json
+from array import array
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, date
+from pathlib import Path, PureWindowsPath
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, List, Dict, Iterable, Iterator, Tuple
+
+from grind_files import PLATFORM_MAP, FILE_RE, ignore_matcher, iter_solution_files, solution_path_matcher, build_manifest, check
+
+if TYPE_CHECKING:
+    import argparse
+
+# --------------------------------------------------
+# Paths
+# --------------------------------------------------
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+README = REPO_ROOT / "README.md"
+CONFIG_FILE = REPO_ROOT / "config" / "grind.json"
+CACHE_FILE = REPO_ROOT / "config" / "grind.cache.json"
+
+# --------------------------------------------------
+# Config Management
+# --------------------------------------------------
+
+def load_config() -> dict:
+    """Load configuration from grind.json"""
+    if not CONFIG_FILE.exists():
+        # Create default config
+        default_config = {
+            "user": {
+                "name": "",
+                "github_username": ""
+            },
+            "readme": {
+                "title": "dsa grind 💪",
+                "show_badges": True,
+                "show_stats_table": True,
+                "show_streak": True,
+                "platforms": ["GeeksForGeeks", "LeetCode", "HackerRank", "Codeforces"],
+                "badge_style": "for-the-badge",
+                "topic_filters": {
+                    "exclude": ["?", "misc"],
+                    "min_count": 1
+                }
+            },
+            "scan": {
+                "ignore": []
+            },
+            "optimization": {
+                "last_update": None,
+                "total_files_scanned": 0,
+                "cache": {
+                    "total_solved": 0,
+                    "total_time_mins": 0,
+                    "current_streak": 0,
+                    "topics": {}
+                }
+            },
+            "stats": {
+                "total_solved": 0,
+                "platforms": {},
+                "longest_streak": 0,
+                "activity": {},
+                "last_scan_timestamp": None
+            }
+        }
+        save_config(default_config)
+        return default_config
+    
+    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write through a temp file in the same directory, then rename over path."""
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def save_config(config: dict) -> None:
+    """Save configuration to grind.json"""
+    atomic_write_text(CONFIG_FILE, json.dumps(config, indent=2, ensure_ascii=False))
+
+# --------------------------------------------------
+# Constants & Config
+# --------------------------------------------------
+
+# PLATFORM_MAP, FILE_RE and file discovery live in
+# grind_files.py so --check can use them without importing this module
+
+def lazy_pattern(*args) -> Callable[[], re.Pattern]:
+    """
+    Accessor for a regex that is compiled on the first call instead of at
+    import time; later calls return the same compiled pattern (a C-level
+    cache hit, no per-use attribute proxying).
+    """
+    return lru_cache(maxsize=None)(lambda: re.compile(*args))
+
+# --------------------------------------------------
+# Data Structures
+# --------------------------------------------------
+
+class Problem(NamedTuple):
+    filename: str
+    platform: str
+    difficulty: str
+    time_spent_str: str
+    time_spent_mins: int
+    created: Optional[date]
+    tries: int
+    topic: str
+    url: str
+
+class StringTable:
+    """Interns repeated strings as small integer codes."""
+
+    __slots__ = ("strings", "codes")
+
+    def __init__(self, seed: Iterable[str] = ()):
+        self.strings: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in seed:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        c = self.codes.get(value)
+        if c is None:
+            c = self.codes[value] = len(self.strings)
+            self.strings.append(value)
+        return c
+
+    def __getitem__(self, code: int) -> str:
+        return self.strings[code]
+
+class PackedStrings:
+    """Append-only column of mostly-unique strings packed into one UTF-8 blob."""
+
+    __slots__ = ("blob", "offsets")
+
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets = array('Q', [0])
+
+    def append(self, value: str) -> None:
+        self.blob += value.encode("utf-8")
+        self.offsets.append(len(self.blob))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+class ProblemStore:
+    """
+    Columnar, list-like container of Problems.
+    platform and difficulty are enum-coded (known values pre-seeded),
+    topics and time strings are interned, filenames and urls are packed
+    into byte blobs, and the numeric fields live in typed arrays; created
+    is a date ordinal, 0 meaning unknown.
+    Indexing and iteration rebuild Problem tuples on the fly, so code
+    written against List[Problem] keeps working.
+    """
+
+    __slots__ = (
+        "filenames", "urls", "platform", "difficulty", "time_spent", "topic",
+        "minutes", "created", "tries", "platforms", "difficulties", "strings",
+    )
+
+    def __init__(self, problems: Iterable[Problem] = ()):
+        self.filenames = PackedStrings()
+        self.urls = PackedStrings()
+        self.platform = array('B')
+        self.difficulty = array('H')
+        self.time_spent = array('I')
+        self.topic = array('I')
+        self.minutes = array('I')
+        self.created = array('I')
+        self.tries = array('H')
+        self.platforms = StringTable(PLATFORM_MAP.values())
+        self.difficulties = StringTable(("easy", "medium", "hard"))
+        # shared by the time_spent and topic columns
+        self.strings = StringTable()
+        self.extend(problems)
+
+    def append(self, p: Problem) -> None:
+        self.filenames.append(p.filename)
+        self.urls.append(p.url)
+        self.platform.append(self.platforms.code(p.platform))
+        self.difficulty.append(self.difficulties.code(p.difficulty))
+        self.time_spent.append(self.strings.code(p.time_spent_str))
+        self.topic.append(self.strings.code(p.topic))
+        self.minutes.append(min(max(p.time_spent_mins, 0), 0xFFFFFFFF))
+        self.created.append(p.created.toordinal() if p.created else 0)
+        self.tries.append(min(max(p.tries, 0), 0xFFFF))
+
+    def extend(self, problems: Iterable[Problem]) -> None:
+        for p in problems:
+            self.append(p)
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        ordinal = self.created[i]
+        return Problem(
+            filename=self.filenames[i],
+            platform=self.platforms[self.platform[i]],
+            difficulty=self.difficulties[self.difficulty[i]],
+            time_spent_str=self.strings[self.time_spent[i]],
+            time_spent_mins=self.minutes[i],
+            created=date.fromordinal(ordinal) if ordinal else None,
+            tries=self.tries[i],
+            topic=self.strings[self.topic[i]],
+            url=self.urls[i],
+        )
+
+    def __iter__(self) -> Iterator[Problem]:
+        for i in range(len(self)):
+            yield self[i]
+
+# --------------------------------------------------
+# Parsing Logic
+# --------------------------------------------------
+
+# Compiled once (on first use) so parsing thousands of files doesn't pay for it per call
+hours_re = lazy_pattern(r'(\d+)\s*h')
+mins_re = lazy_pattern(r'(\d+)\s*m')
+digits_re = lazy_pattern(r'\d+')
+meta_line_re = lazy_pattern(r'^\s*(\w+):\s*(.+)$')
+DOCSTRING_QUOTES = '"""'
+
+def parse_time(time_str: str) -> int:
+    """
+    Parses time strings like "10 mins", "1h 30m", "2 hours" into minutes.
+    Returns 0 if parsing fails or input is ?
+    """
+    if not time_str or "?" in time_str:
+        return 0
+    
+    time_str = time_str.lower().strip()
+    total_mins = 0
+    
+    # Simple regex for finding parts like "1h" or "30m"
+    hours = hours_re().search(time_str)
+    mins = mins_re().search(time_str)
+    
+    if hours:
+        total_mins += int(hours.group(1)) * 60
+    if mins:
+        total_mins += int(mins.group(1))
+        
+    # Fallback: if just a number is given, assume minutes? 
+    # Or if string contains "min", grab the number.
+    if total_mins == 0 and "min" in time_str:
+        num = digits_re().search(time_str)
+        if num:
+            total_mins += int(num.group())
+            
+    return total_mins
+
+# Keys parse_file() needs; reading stops once all of them are seen
+HEADER_KEYS = frozenset({"difficulty", "time_spent", "tries", "topic", "problem_link", "created"})
+
+def header_from_lines(lines: Iterable[str], keys: frozenset = HEADER_KEYS) -> Dict[str, str]:
+    """
+    Collect `key: value` pairs from the first triple-quoted docstring.
+    Consumes lines only up to the closing quotes (or until every key in
+    `keys` is found), so notes and code are never read.
+    Keys are lowercased; first one wins.
+    """
+    meta: Dict[str, str] = {}
+    wanted = len(keys)
+    inside = False
+    match_line = meta_line_re().match
+    for line in lines:
+        if not inside:
+            start = line.find(DOCSTRING_QUOTES)
+            if start < 0:
+                continue
+            line = line[start + 3:]
+            inside = True
+        end = line.find(DOCSTRING_QUOTES)
+        if end >= 0:
+            line = line[:end]
+        m = match_line(line) if ":" in line else None
+        if m:
+            key = m.group(1).lower()
+            if key not in meta:
+                meta[key] = m.group(2).strip()
+                if key in keys:
+                    wanted -= 1
+        if end >= 0 or not wanted:
+            break
+    return meta
+
+def read_header(path: Path, keys: frozenset = HEADER_KEYS) -> Dict[str, str]:
+    """header_from_lines() over a file, streamed line by line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return header_from_lines(f, keys)
+
+def parse_file(path: Path, filename: Optional[str] = None) -> Optional[Problem]:
+    """Parse a solution file; `filename` is its repo-relative path (defaults to the bare name)."""
+    m = FILE_RE.match(path.name)
+    if not m:
+        return None
+    return problem_from_meta(m.group("platform"), read_header(path), filename or path.name)
+
+def parse_and_digest(path: Path, filename: Optional[str] = None) -> Tuple[Optional[Problem], str]:
+    """parse_file() plus the file's sha1 for the cache, both from a single read."""
+    import hashlib
+
+    data = path.read_bytes()
+    m = FILE_RE.match(path.name)
+    prob = None
+    if m:
+        meta = header_from_lines(data.decode("utf-8").splitlines())
+        prob = problem_from_meta(m.group("platform"), meta, filename or path.name)
+    return prob, hashlib.sha1(data).hexdigest()
+
+def parse_text(filename: str, text: str) -> Optional[Problem]:
+    """parse_file() for contents that aren't on disk (e.g. a git blob); `filename` is the repo-relative path."""
+    m = FILE_RE.match(filename.rsplit("/", 1)[-1])
+    if not m:
+        return None
+    return problem_from_meta(m.group("platform"), header_from_lines(text.splitlines()), filename)
+
+def problem_from_meta(platform_key: str, meta: Dict[str, str], filename: str) -> Problem:
+    platform = PLATFORM_MAP.get(platform_key, "unknown")
+
+    difficulty = meta.get("difficulty", "Unknown")
+    time_str = meta.get("time_spent", "?")
+    time_mins = parse_time(time_str)
+    tries_match = digits_re().search(meta.get("tries", "1"))
+    tries = int(tries_match.group()) if tries_match else 1
+    topic = meta.get("topic", "misc")
+    url = meta.get("problem_link", "#")
+    created_str = meta.get("created", "?")
+    
+    created_date = None
+    if created_str and "?" not in created_str:
+        try:
+            created_date = date.fromisoformat(created_str)
+        except ValueError:
+            try:
+                # strptime also takes unpadded dates like 2026-1-5
+                created_date = datetime.strptime(created_str, "%Y-%m-%d").date()
+            except ValueError:
+                pass # ignore bad dates
+
+    return Problem(
+        filename=filename,
+        platform=platform,
+        difficulty=difficulty,
+        time_spent_str=time_str,
+        time_spent_mins=time_mins,
+        created=created_date,
+        tries=tries,
+        topic=topic,
+        url=url
+    )
+
+# --------------------------------------------------
+# Metadata Cache
+# --------------------------------------------------
+
+# Bump whenever parse_file()'s output or the entry layout changes, so old caches are dropped
+# 2: header-only parser, repo-relative filenames, activity index
+CACHE_VERSION = 2
+
+def load_cache() -> dict:
+    """Load the per-file metadata cache, or an empty one if missing/stale."""
+    empty = {"version": CACHE_VERSION, "files": {}}
+    if not CACHE_FILE.exists():
+        return empty
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return empty
+    cache.setdefault("files", {})
+    return cache
+
+def save_cache(cache: dict) -> None:
+    """Save the per-file metadata cache next to grind.json"""
+    atomic_write_text(CACHE_FILE, json.dumps(cache, separators=(",", ":"), ensure_ascii=False))
+
+def file_digest(path: Path) -> str:
+    import hashlib
+
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+def problem_to_record(p: Problem) -> dict:
+    record = p._asdict()
+    record["created"] = p.created.isoformat() if p.created else None
+    return record
+
+def problem_from_record(record: dict) -> Problem:
+    created = record.get("created")
+    return Problem(**{**record, "created": date.fromisoformat(created) if created else None})
+
+def cache_entry(st, prob: Optional[Problem], digest: str) -> dict:
+    return {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha1": digest,
+        "problem": problem_to_record(prob) if prob else None,
+    }
+
+def lookup_cached(path: Path, st, entry: Optional[dict]) -> Optional[Problem]:
+    """
+    Return the cached Problem for path if the file hasn't changed.
+    mtime/size is the fast path; when only the mtime moved (fresh checkout,
+    touch, etc.) the content hash decides.
+    """
+    if not entry:
+        return None
+    if entry["size"] != st.st_size:
+        return None
+    if entry["mtime_ns"] != st.st_mtime_ns:
+        if file_digest(path) != entry["sha1"]:
+            return None
+        entry["mtime_ns"] = st.st_mtime_ns
+    record = entry.get("problem")
+    return problem_from_record(record) if record else None
+
+# --------------------------------------------------
+# Parallel Parsing
+# --------------------------------------------------
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+PARSE_CHUNK_SIZE = 64
+
+def parse_chunk(items: List[Tuple[Path, str]], digest: bool = False) -> list:
+    """Parse each (path, filename); with digest, (Problem, sha1) pairs from one read per file."""
+    if digest:
+        return [parse_and_digest(path, filename) for path, filename in items]
+    return [parse_file(path, filename) for path, filename in items]
+
+class ParseQueue:
+    """
+    Collects files to parse while discovery is still walking the tree.
+    Once enough have queued up, chunks go to a process pool as they fill;
+    results() yields in the order files were put, so output is identical
+    to a serial run. With digest, results are (Problem, sha1) pairs and
+    the hashing happens in the workers too.
+    """
+
+    def __init__(self, jobs: int = 1, digest: bool = False):
+        self.jobs = jobs
+        self.digest = digest
+        self.pending: List[Tuple[Path, str]] = []
+        self.futures = []
+        self.pool = None
+
+    def put(self, path: Path, filename: str) -> None:
+        self.pending.append((path, filename))
+        if self.jobs <= 1 or len(self.pending) < PARSE_CHUNK_SIZE:
+            return
+        if self.pool is None:
+            if len(self.pending) < PARALLEL_MIN_FILES:
+                return
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(max_workers=self.jobs)
+        self.futures.append(self.pool.submit(parse_chunk, self.pending, self.digest))
+        self.pending = []
+
+    def results(self) -> Iterator:
+        try:
+            for future in self.futures:
+                yield from future.result()
+            yield from parse_chunk(self.pending, self.digest)
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+
+def record_ordinal(entry: Optional[dict]) -> int:
+    """Date ordinal of a cache entry's created date, 0 if it has none."""
+    record = entry and entry.get("problem")
+    created = record and record.get("created")
+    return date.fromisoformat(created).toordinal() if created else 0
+
+def scan_problems(cache: Optional[dict] = None, jobs: int = 1, ignore: Iterable[str] = ()) -> ProblemStore:
+    """
+    Recursively scan the repo for solution files.
+    With a cache, only files that were added or changed are parsed, and
+    entries for deleted files are dropped. Changed files are parsed with
+    `jobs` worker processes while the walk continues. The cache's activity
+    index is adjusted by the same deltas instead of being rebuilt.
+    """
+    cached_files = cache["files"] if cache is not None else {}
+    activity = None
+    if cache is not None and "activity" in cache:
+        activity = ActivityIndex.from_dict(cache["activity"])
+    seen = {}
+    slots: List[Optional[Problem]] = []
+    misses = []
+    queue = ParseQueue(jobs, digest=cache is not None)
+    for entry, rel in iter_solution_files(REPO_ROOT, ignore):
+        path = Path(entry.path)
+        st = entry.stat()
+        cached = cached_files.get(rel)
+        prob = lookup_cached(path, st, cached)
+        if prob is None:
+            misses.append((len(slots), rel, path, st))
+            queue.put(path, rel)
+        seen[rel] = cached
+        slots.append(prob)
+
+    for (slot, rel, path, st), result in zip(misses, queue.results()):
+        if cache is None:
+            slots[slot] = result
+            continue
+        prob, digest = result
+        old_ordinal = record_ordinal(seen[rel])
+        seen[rel] = cache_entry(st, prob, digest)
+        slots[slot] = prob
+        if activity is not None:
+            if old_ordinal:
+                activity.add(old_ordinal, -1)
+            activity.add_date(prob.created if prob else None)
+
+    store = ProblemStore(p for p in slots if p)
+    if cache is not None:
+        if activity is None:
+            activity = StatsAggregate.from_problems(store).activity
+        else:
+            for rel in cached_files.keys() - seen.keys():
+                ordinal = record_ordinal(cached_files[rel])
+                if ordinal:
+                    activity.add(ordinal, -1)
+        cache["files"] = seen
+        cache["activity"] = activity.to_dict()
+    return store
+
+# --------------------------------------------------
+# CPH Normalization
+# --------------------------------------------------
+
+class CphReport(NamedTuple):
+    updated: int
+    orphans: List[str]
+    removed: int
+
+def cph_target_name(value: str) -> Optional[str]:
+    """Bare solution filename a .prob url/srcPath points at (file: URI, Windows or POSIX path)."""
+    if not value:
+        return None
+    if value.startswith("file:"):
+        try:
+            from urllib.parse import urlparse, unquote
+
+            value = unquote(urlparse(value).path)
+        except ValueError:
+            return None
+    # PureWindowsPath splits on both separators
+    return PureWindowsPath(value).name or None
+
+def normalize_prob(data: object, filename_to_rel: Dict[str, str]) -> Tuple[bool, Optional[str]]:
+    """Rewrite url/srcPath in a decoded .prob; returns (changed, solution name it points at)."""
+    changed = False
+    target = None
+    if not isinstance(data, dict):
+        return changed, target
+    for key in ("url", "srcPath"):
+        value = data.get(key)
+        if not isinstance(value, str):
+            continue
+        name = cph_target_name(value)
+        if not name:
+            continue
+        target = target or name
+        new_val = filename_to_rel.get(name) or filename_to_rel.get(name.lower())
+        if new_val and value != new_val:
+            data[key] = new_val
+            changed = True
+    return changed, target
+
+def normalize_cph_paths(problems: Iterable[Problem], cache: Optional[dict] = None, gc: bool = False) -> CphReport:
+    """
+    Normalize .cph .prob url/srcPath to relative paths (.\\filename format).
+    With a cache, an index of .prob name -> (mtime, size, target, value)
+    lets unchanged files whose solution still maps to the same path be
+    skipped without opening them. .prob files whose solution is gone are
+    reported as orphans, and deleted when gc is set. Rewrites are atomic.
+    """
+    return normalize_cph_targets(cph_targets(p.filename for p in problems), cache, gc)
+
+def cph_targets(filenames: Iterable[str]) -> Dict[str, str]:
+    """Bare solution name (and its lowercase form) -> .\\rel\\path for .prob files."""
+    filename_to_rel = {}
+    for filename in filenames:
+        rel_path = ".\\" + filename.replace("/", "\\")
+        name = filename.rsplit("/", 1)[-1]
+        filename_to_rel[name] = rel_path
+        filename_to_rel[name.lower()] = rel_path
+    return filename_to_rel
+
+def normalize_cph_targets(filename_to_rel: Dict[str, str], cache: Optional[dict] = None, gc: bool = False) -> CphReport:
+    """normalize_cph_paths() with the name -> path map already built."""
+    cph_dir = REPO_ROOT / ".cph"
+    if not cph_dir.exists():
+        return CphReport(0, [], 0)
+
+    def resolve(name: Optional[str]) -> Optional[str]:
+        if not name:
+            return None
+        return filename_to_rel.get(name) or filename_to_rel.get(name.lower())
+
+    old_index = cache.get("cph", {}) if cache is not None else {}
+    index = {}
+    updated = 0
+    orphans = []
+    with os.scandir(cph_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".prob") or not entry.is_file():
+                continue
+            st = entry.stat()
+            known = old_index.get(entry.name)
+            if known and known["mtime_ns"] == st.st_mtime_ns and known["size"] == st.st_size:
+                if known["target"] and resolve(known["target"]) is None:
+                    orphans.append(entry.name)
+                    index[entry.name] = known
+                    continue
+                if resolve(known["target"]) == known["value"]:
+                    index[entry.name] = known
+                    continue
+
+            prob_file = Path(entry.path)
+            try:
+                data = json.loads(prob_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+            changed, target = normalize_prob(data, filename_to_rel)
+            if changed:
+                atomic_write_text(prob_file, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+                st = prob_file.stat()
+                updated += 1
+            if target and resolve(target) is None:
+                orphans.append(entry.name)
+            index[entry.name] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "target": target,
+                "value": resolve(target),
+            }
+
+    removed = 0
+    if gc:
+        for name in orphans:
+            try:
+                (cph_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+            index.pop(name, None)
+            removed += 1
+
+    if cache is not None:
+        cache["cph"] = index
+    return CphReport(updated, sorted(orphans), removed)
+
+def print_cph_report(report: CphReport) -> None:
+    if report.updated:
+        print(f"🔧 Updated {report.updated} .cph file(s) to use configured paths")
+    if report.removed:
+        print(f"🗑️ Removed {report.removed} orphaned .cph file(s)")
+    elif report.orphans:
+        print(f"🧹 {len(report.orphans)} orphaned .cph file(s) (solution no longer exists):")
+        for name in report.orphans[:10]:
+            print(f"   - {name}")
+        if len(report.orphans) > 10:
+            print(f"   ... and {len(report.orphans) - 10} more")
+        print("   run with --gc-cph to delete them")
+
+# --------------------------------------------------
+# Stats Calculation
+# --------------------------------------------------
+
+SLUG_TO_NAME = {v: k for k, v in PLATFORM_MAP.items()}
+DIFFICULTIES = ("easy", "medium", "hard")
+
+def display_platform(slug: str) -> str:
+    return SLUG_TO_NAME.get(slug, slug.title())
+
+class ActivityIndex:
+    """
+    Problems solved per active day, keyed by date ordinal.
+    Streak checks are set lookups, so the current streak costs O(streak)
+    no matter how much history there is. Counts can go up and down, which
+    lets the metadata cache apply per-file deltas instead of rebuilding.
+    """
+
+    __slots__ = ("days",)
+
+    def __init__(self, days: Optional[Dict[int, int]] = None):
+        self.days: Counter = Counter(days or {})
+
+    def add(self, ordinal: int, n: int = 1) -> None:
+        count = self.days[ordinal] + n
+        if count > 0:
+            self.days[ordinal] = count
+        else:
+            del self.days[ordinal]
+
+    def add_date(self, d: Optional[date], n: int = 1) -> None:
+        if d:
+            self.add(d.toordinal(), n)
+
+    def __iadd__(self, other: "ActivityIndex") -> "ActivityIndex":
+        for ordinal, n in other.days.items():
+            self.add(ordinal, n)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ActivityIndex) and self.days == other.days
+
+    def to_dict(self) -> Dict[str, int]:
+        return {str(k): v for k, v in sorted(self.days.items())}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, int]) -> "ActivityIndex":
+        return cls({int(k): v for k, v in data.items()})
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        # If we haven't solved anything today, yesterday keeps the streak alive
+        check = (today or datetime.now().date()).toordinal()
+        if check not in self.days:
+            check -= 1
+        streak = 0
+        while check in self.days:
+            streak += 1
+            check -= 1
+        return streak
+
+    def summary(self, today: Optional[date] = None) -> dict:
+        """
+        Longest streak, per-ISO-week and per-month counts and a sparse
+        rolling 365-day heatmap (date -> count), in one pass over the index.
+        """
+        today_ord = (today or datetime.now().date()).toordinal()
+        window_start = today_ord - 364
+        by_week: Counter = Counter()
+        by_month: Counter = Counter()
+        heatmap = {}
+        longest = 0
+        for ordinal, n in self.days.items():
+            d = date.fromordinal(ordinal)
+            year, week, _ = d.isocalendar()
+            by_week[f"{year}-W{week:02d}"] += n
+            by_month[f"{d.year}-{d.month:02d}"] += n
+            if window_start <= ordinal <= today_ord:
+                heatmap[d.isoformat()] = n
+            # only walk runs from their first day, so every day is visited once
+            if ordinal - 1 not in self.days:
+                run = 1
+                while ordinal + run in self.days:
+                    run += 1
+                longest = max(longest, run)
+        return {
+            "longest_streak": longest,
+            "by_week": dict(sorted(by_week.items())),
+            "by_month": dict(sorted(by_month.items())),
+            "heatmap": dict(sorted(heatmap.items())),
+        }
+
+class StatsAggregate:
+    """
+    Every number the README and grind.json need, accumulated in one pass.
+    Only sums and counts are kept (averages are derived at render time),
+    so problems can be removed again and aggregates from separate scans
+    can be merged with `+=`.
+    """
+
+    __slots__ = ("total_solved", "total_time_mins", "platforms", "topics", "activity")
+
+    def __init__(self):
+        self.total_solved = 0
+        self.total_time_mins = 0
+        # display name -> Counter(count, easy, medium, hard, time_sum, timed, tries_sum)
+        self.platforms: Dict[str, Counter] = {}
+        # every non-empty topic; exclusions are applied by the renderers
+        self.topics: Counter = Counter()
+        self.activity = ActivityIndex()
+
+    @classmethod
+    def from_problems(cls, problems: Iterable[Problem], activity: Optional[ActivityIndex] = None) -> "StatsAggregate":
+        """
+        Aggregate problems in one pass. A prebuilt activity index (e.g. the
+        one kept up to date in the metadata cache) replaces counting days.
+        """
+        agg = cls()
+        if isinstance(problems, ProblemStore):
+            agg.add_store(problems, with_days=activity is None)
+        else:
+            for p in problems:
+                agg.add(p, with_days=activity is None)
+        if activity is not None:
+            agg.activity = activity
+        return agg
+
+    def add_store(self, store: ProblemStore, with_days: bool = True) -> None:
+        """Same as add() for every problem, but over the store's columns."""
+        self.total_solved += len(store)
+        self.total_time_mins += sum(store.minutes)
+
+        # group by (platform, difficulty) code pairs, then expand each pair once
+        groups: Dict[Tuple[int, int], Counter] = {}
+        for pc, dc, mins, tries in zip(store.platform, store.difficulty, store.minutes, store.tries):
+            g = groups.get((pc, dc))
+            if g is None:
+                g = groups[(pc, dc)] = Counter()
+            g["count"] += 1
+            g["tries_sum"] += tries
+            if mins > 0:
+                g["time_sum"] += mins
+                g["timed"] += 1
+        for (pc, dc), g in groups.items():
+            name = display_platform(store.platforms[pc])
+            plat = self.platforms.setdefault(name, Counter())
+            plat.update(g)
+            difficulty = store.difficulties[dc].lower()
+            for level in DIFFICULTIES:
+                if level in difficulty:
+                    plat[level] += g["count"]
+
+        for code, n in Counter(store.topic).items():
+            for topic in store.strings[code].split(','):
+                topic = topic.strip().lower()
+                if topic:
+                    self.topics[topic] += n
+
+        if with_days:
+            for ordinal, n in Counter(store.created).items():
+                if ordinal:
+                    self.activity.add(ordinal, n)
+
+    def add(self, p: Problem, sign: int = 1, with_days: bool = True) -> None:
+        self.total_solved += sign
+        self.total_time_mins += sign * p.time_spent_mins
+
+        name = display_platform(p.platform)
+        plat = self.platforms.get(name)
+        if plat is None:
+            plat = self.platforms[name] = Counter()
+        plat["count"] += sign
+        difficulty = p.difficulty.lower()
+        for level in DIFFICULTIES:
+            if level in difficulty:
+                plat[level] += sign
+        if p.time_spent_mins > 0:
+            plat["time_sum"] += sign * p.time_spent_mins
+            plat["timed"] += sign
+        plat["tries_sum"] += sign * p.tries
+        if plat["count"] <= 0:
+            del self.platforms[name]
+
+        for topic in p.topic.split(','):
+            topic = topic.strip().lower()
+            if topic:
+                self.topics[topic] += sign
+                if self.topics[topic] <= 0:
+                    del self.topics[topic]
+
+        if with_days:
+            self.activity.add_date(p.created, sign)
+
+    def remove(self, p: Problem) -> None:
+        self.add(p, sign=-1)
+
+    def to_dict(self) -> dict:
+        # zero counts are dropped so incremental and full runs compare equal
+        return {
+            "total_solved": self.total_solved,
+            "total_time_mins": self.total_time_mins,
+            "platforms": {name: {k: v for k, v in plat.items() if v} for name, plat in self.platforms.items()},
+            "topics": dict(self.topics),
+            "activity": self.activity.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatsAggregate":
+        agg = cls()
+        agg.total_solved = data["total_solved"]
+        agg.total_time_mins = data["total_time_mins"]
+        agg.platforms = {name: Counter(plat) for name, plat in data["platforms"].items()}
+        agg.topics = Counter(data["topics"])
+        agg.activity = ActivityIndex.from_dict(data["activity"])
+        return agg
+
+    def __iadd__(self, other: "StatsAggregate") -> "StatsAggregate":
+        self.total_solved += other.total_solved
+        self.total_time_mins += other.total_time_mins
+        for name, plat in other.platforms.items():
+            self.platforms.setdefault(name, Counter()).update(plat)
+        self.topics.update(other.topics)
+        self.activity += other.activity
+        return self
+
+def calc_streak(activity: ActivityIndex, today: Optional[date] = None) -> int:
+    return activity.current_streak(today)
+
+def format_duration(minutes: int) -> str:
+    if minutes < 60:
+        return f"{minutes}m"
+    h, m = divmod(minutes, 60)
+    return f"{h}h {m}m"
+
+def generate_topics_breakdown(stats: StatsAggregate, config: dict) -> str:
+    """Generate a markdown list of topics covered with counts."""
+    topic_filters = config.get("readme", {}).get("topic_filters", {})
+    exclude = topic_filters.get("exclude", ["?", "misc"])
+    min_count = topic_filters.get("min_count", 1)
+    
+    topic_counter = {k: v for k, v in stats.topics.items() if k not in exclude}
+    
+    if not topic_counter:
+        return "_No topics tracked yet._"
+    
+    # Filter by min_count
+    topic_counter = {k: v for k, v in topic_counter.items() if v >= min_count}
+    
+    # Sort by count (descending), then alphabetically
+    sorted_topics = sorted(topic_counter.items(), key=lambda x: (-x[1], x[0]))
+    
+    lines = []
+    for topic, count in sorted_topics:
+        # Format: "arrays (12)", "hashing (8)", etc.
+        lines.append(f"- **{topic}** ({count})")
+    
+    return "\n".join(lines)
+
+# --------------------------------------------------
+# Markdown Generation
+# --------------------------------------------------
+
+def generate_badges(total_solved: int, streak: int, total_time_mins: int, config: dict) -> str:
+    """Generate badges based on config settings."""
+    readme_config = config.get("readme", {})
+    badge_style = readme_config.get("badge_style", "for-the-badge")
+    show_streak = readme_config.get("show_streak", True)
+    
+    badges = []
+    badges.append(f"![Solved](https://img.shields.io/badge/Solved-{total_solved}-blue?style={badge_style})")
+    
+    if show_streak:
+        badges.append(f"![Streak](https://img.shields.io/badge/Streak-{streak}%20Days-orange?style={badge_style})")
+    
+    time_str = format_duration(total_time_mins).replace(" ", "%20")
+    badges.append(f"![Time Spent](https://img.shields.io/badge/Time%20Spent-{time_str}-success?style={badge_style})")
+    
+    return " ".join(badges)
+
+def generate_progress_table(stats: StatsAggregate, config: dict) -> str:
+    """Generate stats table based on config platform order."""
+    readme_config = config.get("readme", {})
+    platform_order = readme_config.get("platforms", ["GeeksForGeeks", "LeetCode", "HackerRank", "Codeforces"])
+    
+    # Add any others found
+    remaining_keys = sorted([k for k in stats.platforms.keys() if k not in platform_order])
+    final_order = platform_order + remaining_keys
+    
+    lines = []
+    # Columns: Platform | Solved | Easy | Medium | Hard | Avg Time | Avg Tries | Vibe
+    lines.append("| Platform | Solved | Easy | Medium | Hard | Avg Time | Avg Tries | Vibe |")
+    lines.append("| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :--- |")
+    
+    for plat in final_order:
+        # Counter returns 0 for anything missing, so unseen platforms show 0s
+        counts = stats.platforms.get(plat, Counter())
+        count = counts["count"]
+        # Only skip if empty AND not in our main list (we want to show 0s for main platforms)
+        if not count and plat not in platform_order:
+            continue
+        
+        # Difficulty breakdown
+        easy, medium, hard = counts["easy"], counts["medium"], counts["hard"]
+        
+        # Avg Stats
+        avg_time = int(counts["time_sum"] / counts["timed"]) if counts["timed"] else 0
+        avg_tries = counts["tries_sum"] / count if count else 0.0
+        
+        # Vibe Check
+        vibe = "ghost town"
+        if count > 0:
+            vibe = "warming up"
+            if count > 10: vibe = "cooking"
+            if count > 50: vibe = "on fire"
+            if "LeetCode" in plat and hard > 5: vibe = "god mode"
+        
+        # Row
+        avg_tries_str = f"{avg_tries:.1f}" if count > 0 else "-"
+        avg_time_str = format_duration(avg_time) if count > 0 else "-"
+        
+        lines.append(f"| **{plat}** | {count} | {easy} | {medium} | {hard} | {avg_time_str} | {avg_tries_str} | {vibe} |")
+        
+    return "\n".join(lines)
+
+# Sections are either a bare placeholder (<!-- GRIND_TOPICS -->) or a
+# START/END pair left behind by a previous run, which is updated in place.
+SECTIONS = ("BADGES", "STATS_TABLE", "TOPICS", "TIMESTAMP")
+BLOCK_SECTIONS = ("STATS_TABLE", "TOPICS")
+marker_re = lazy_pattern(
+    rf"<!-- GRIND_(?P<name>{'|'.join(SECTIONS)})(?::START -->.*?<!-- GRIND_(?P=name):END)? -->",
+    re.DOTALL,
+)
+
+def fingerprint(text: str) -> str:
+    import hashlib
+
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+def render_markers(text: str, sections: Dict[str, str]) -> str:
+    """Replace every placeholder or START/END pair with its section, keeping the markers."""
+    def wrap(m: re.Match) -> str:
+        name = m.group("name")
+        body = sections.get(name, "")
+        if name in BLOCK_SECTIONS:
+            body = f"\n\n{body}\n\n"
+        return f"<!-- GRIND_{name}:START -->{body}<!-- GRIND_{name}:END -->"
+
+    return marker_re().sub(wrap, text)
+
+def section_body(text: str, name: str) -> Optional[str]:
+    """What's between a section's START/END markers now, or None if it hasn't been rendered."""
+    start, end = f"<!-- GRIND_{name}:START -->", f"<!-- GRIND_{name}:END -->"
+    at = text.find(start)
+    if at < 0:
+        return None
+    stop = text.find(end, at)
+    return text[at + len(start):stop] if stop >= 0 else None
+
+def update_readme(stats: StatsAggregate, config: dict) -> bool:
+    """
+    Update README sections and save optimization data to config.
+    The README is skipped only if rendering it again would give the same text
+    (so a stale README from a merge or revert gets repaired); grind.json is
+    skipped only if the fingerprints of its stats match the last run.
+    When neither is stale, neither file is touched.
+    The timestamp only moves when something else changed.
+    Returns True if anything was written.
+    """
+    if not README.exists():
+        return False
+    
+    # Calculate stats
+    streak = calc_streak(stats.activity)
+    activity = stats.activity.summary()
+    total_time = stats.total_time_mins
+    total_solved = stats.total_solved
+    timestamp = datetime.now().strftime("%Y-%m-%d")
+    
+    # Generate content based on config
+    readme_config = config.get("readme", {})
+    
+    badges_md = ""
+    if readme_config.get("show_badges", True):
+        badges_md = generate_badges(total_solved, streak, total_time, config)
+    
+    stats_table = ""
+    if readme_config.get("show_stats_table", True):
+        stats_table = generate_progress_table(stats, config)
+    
+    topics_md = ""
+    if readme_config.get("show_topics", True):
+        topics_md = generate_topics_breakdown(stats, config)
+    
+    sections = {"BADGES": badges_md, "STATS_TABLE": stats_table, "TOPICS": topics_md}
+    
+    topic_counter = {k: v for k, v in stats.topics.items() if k not in ["?", "misc"]}
+    platform_stats = {
+        platform: {key: counts[key] for key in ("count",) + DIFFICULTIES}
+        for platform, counts in stats.platforms.items()
+    }
+    
+    fingerprints = {name: fingerprint(md) for name, md in sections.items()}
+    fingerprints["stats"] = fingerprint(json.dumps(
+        [total_solved, total_time, streak, topic_counter, platform_stats, activity], sort_keys=True
+    ))
+    
+    text = README.read_text(encoding="utf-8")
+    shown_timestamp = section_body(text, "TIMESTAMP")
+    if shown_timestamp is None:  # not rendered yet, or no timestamp in this README
+        shown_timestamp = timestamp
+    readme_current = render_markers(text, {**sections, "TIMESTAMP": shown_timestamp}) == text
+    if readme_current and fingerprints == config["optimization"].get("sections"):
+        print(f"✨ Stats unchanged ({total_solved} problems), nothing to write")
+        return False
+    
+    # Write updated README
+    sections["TIMESTAMP"] = timestamp
+    new_text = render_markers(text, sections)
+    if new_text != text:
+        atomic_write_text(README, new_text)
+    
+    # Update optimization cache in config
+    config["optimization"]["last_update"] = timestamp
+    config["optimization"]["total_files_scanned"] = total_solved
+    config["optimization"]["cache"]["total_solved"] = total_solved
+    config["optimization"]["cache"]["total_time_mins"] = total_time
+    config["optimization"]["cache"]["current_streak"] = streak
+    config["optimization"]["cache"]["topics"] = topic_counter
+    config["optimization"]["sections"] = fingerprints
+    
+    # Update stats section
+    config["stats"]["total_solved"] = total_solved
+    config["stats"]["platforms"] = platform_stats
+    config["stats"]["longest_streak"] = activity.pop("longest_streak")
+    config["stats"]["activity"] = activity
+    config["stats"]["last_scan_timestamp"] = timestamp
+    
+    # Save updated config
+    save_config(config)
+    
+    # Display results
+    user_info = config.get("user", {})
+    user_name = user_info.get("name", "")
+    
+    if user_name:
+        print(f"✅ README updated for {user_name}!")
+    
+    print(f"📊 {total_solved} problems solved, {streak} day streak!")
+    print(f"💾 Stats saved to grind.json")
+    return True
+
+# --------------------------------------------------
+# Git Incremental Mode
+# --------------------------------------------------
+
+def git(*args: str, stdin: Optional[bytes] = None) -> Optional[bytes]:
+    """Run git in the repo; None if git is missing or the command fails."""
+    import subprocess
+
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, input=stdin, capture_output=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def git_head() -> Optional[str]:
+    out = git("rev-parse", "--verify", "HEAD")
+    return out.decode().strip() if out else None
+
+def git_changes(since: str, head: str) -> Optional[List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    (old_path, new_path) per path changed between two commits, repo-relative.
+    Added files have no old path, deleted ones no new path, renames both.
+    None when `since` isn't in the local history (shallow clone, rewrite).
+    """
+    out = git("diff", "--name-status", "-M", "-z", "--relative", since, head, "--")
+    if out is None:
+        return None
+    fields = out.decode("utf-8", "surrogateescape").split("\0")
+    pairs = []
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i][:1]
+        if status in "RC":
+            old, new = fields[i + 1], fields[i + 2]
+            pairs.append((old if status == "R" else None, new))
+            i += 3
+            continue
+        path = fields[i + 1]
+        if status == "A":
+            pairs.append((None, path))
+        elif status == "D":
+            pairs.append((path, None))
+        else:
+            pairs.append((path, path))
+        i += 2
+    return pairs
+
+def git_blobs(specs: List[str]) -> Optional[List[Optional[str]]]:
+    """Contents of `rev:./path` specs via one `git cat-file --batch`; None per missing object."""
+    if not specs:
+        return []
+    out = git("cat-file", "--batch", stdin="".join(spec + "\n" for spec in specs).encode("utf-8"))
+    if out is None:
+        return None
+    texts: List[Optional[str]] = []
+    pos = 0
+    for _ in specs:
+        eol = out.index(b"\n", pos)
+        header = out[pos:eol].split()
+        pos = eol + 1
+        if header[-1] == b"missing":
+            texts.append(None)
+            continue
+        size = int(header[2])
+        texts.append(out[pos:pos + size].decode("utf-8", "replace"))
+        pos += size + 1
+    return texts
+
+def git_solution_files(ignore: Iterable[str]) -> List[str]:
+    """
+    Solution paths from the index instead of a tree walk: tracked files plus
+    untracked ones that aren't gitignored (a fresh new_problem.py file is
+    live too). Falls back to walking the tree if git can't list them, since
+    --gc-cph treats anything missing here as orphaned.
+    """
+    out = git("ls-files", "-z", "--cached", "--others", "--exclude-standard")
+    if out is None:
+        return [rel for _, rel in iter_solution_files(REPO_ROOT, ignore)]
+    is_solution = solution_path_matcher(ignore)
+    return [p for p in (out or b"").decode("utf-8", "surrogateescape").split("\0") if p and is_solution(p)]
+
+def git_clean_head(ignore: Iterable[str]) -> Optional[str]:
+    """
+    HEAD if the working tree matches it for every solution file, else None:
+    stats from a full scan only describe a commit when nothing is pending.
+    """
+    head = git_head()
+    out = git("status", "--porcelain", "-z", "--untracked-files=all")
+    if head is None or out is None:
+        return None
+    is_solution = solution_path_matcher(ignore)
+    fields = out.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if not record:
+            continue
+        paths = [record[3:]]
+        if record[0] in "RC":
+            # renames carry the original path as an extra field
+            paths.append(fields[i])
+            i += 1
+        if any(is_solution(path) for path in paths):
+            return None
+    return head
+
+def git_incremental(config: dict, ignore: List[str]) -> Optional[Tuple[StatsAggregate, str, bool]]:
+    """
+    Bring the aggregate stored in grind.json forward from
+    optimization.last_commit to HEAD using only what git says changed:
+    old versions are read from the old commit and subtracted, new ones
+    from HEAD and added, so renames and deletions net out correctly.
+    Returns (aggregate, head, whether .cph files may need normalizing),
+    or None when a full rescan is needed instead.
+    """
+    opt = config["optimization"]
+    last = opt.get("last_commit")
+    saved = opt.get("aggregate")
+    head = git_head()
+    if head is None:
+        reason = "not a git checkout"
+    elif not last or not saved:
+        reason = "no stats commit recorded yet"
+    elif saved.get("ignore") != ignore:
+        reason = "scan.ignore changed"
+    else:
+        reason = None
+    pairs = git_changes(last, head) if reason is None else None
+    if reason is None and pairs is None:
+        reason = f"{last[:12]} is not in the local history (shallow clone?)"
+    if reason is not None:
+        print(f"↩️  Full scan: {reason}")
+        return None
+
+    is_solution = solution_path_matcher(ignore)
+    old_paths = [old for old, _ in pairs if old and is_solution(old)]
+    new_paths = [new for _, new in pairs if new and is_solution(new)]
+    texts = git_blobs([f"{last}:./{p}" for p in old_paths] + [f"{head}:./{p}" for p in new_paths])
+    if texts is None:
+        print("↩️  Full scan: could not read changed files from git")
+        return None
+
+    stats = StatsAggregate.from_dict(saved["stats"])
+    for path, text in zip(old_paths, texts):
+        prob = parse_text(path, text) if text is not None else None
+        if prob:
+            stats.remove(prob)
+    for path, text in zip(new_paths, texts[len(old_paths):]):
+        prob = parse_text(path, text) if text is not None else None
+        if prob:
+            stats.add(prob)
+
+    # solutions appearing, moving or disappearing can change .prob targets
+    cph_dirty = any(
+        (new or "").startswith(".cph/")
+        or (old != new and is_solution(old or new))
+        for old, new in pairs
+    )
+    print(f"🔀 {len(old_paths) + len(new_paths)} solution file version(s) applied since {last[:12]}")
+    return stats, head, cph_dirty
+
+def record_git_state(config: dict, stats: StatsAggregate, head: Optional[str], ignore: List[str], reset: bool = False) -> bool:
+    """
+    Keep optimization.aggregate equal to the stats of the tree at
+    optimization.last_commit. The commit only moves when the numbers do,
+    so pushes that change no stats don't dirty grind.json; `reset` moves
+    it anyway (the recorded one just proved unusable).
+    Returns True if config needs saving.
+    """
+    opt = config["optimization"]
+    state = {"ignore": ignore, "stats": stats.to_dict()}
+    moved = reset and head is not None and head != opt.get("last_commit")
+    if opt.get("aggregate") == state and not moved and (opt.get("last_commit") or head is None):
+        return False
+    opt["aggregate"] = state
+    opt["last_commit"] = head
+    return True
+
+# --------------------------------------------------
+# Watch Mode
+# --------------------------------------------------
+
+class PollingWatcher:
+    """Stat-polling backend: diffs (mtime, size) snapshots of every solution file."""
+
+    def __init__(self, ignore: Iterable[str] = (), interval: float = 1.0):
+        self.ignore = list(ignore)
+        self.interval = interval
+        self.state = self.snapshot()
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        state = {}
+        for entry, rel in iter_solution_files(REPO_ROOT, self.ignore):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            state[rel] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def poll(self, timeout: Optional[float] = None) -> set:
+        """Relative paths created, modified or deleted; blocks until one changes if timeout is None."""
+        import time
+
+        while True:
+            time.sleep(self.interval if timeout is None else timeout)
+            state = self.snapshot()
+            old, self.state = self.state, state
+            changed = {rel for rel in old.keys() | state.keys() if old.get(rel) != state.get(rel)}
+            if changed or timeout is not None:
+                return changed
+
+class InotifyWatcher:
+    """inotify backend (needs the optional inotify_simple package); one watch per directory."""
+
+    def __init__(self, ignore: Iterable[str] = ()):
+        from inotify_simple import INotify, flags
+
+        self.flags = flags
+        self.mask = (flags.CREATE | flags.CLOSE_WRITE | flags.DELETE
+                     | flags.MOVED_FROM | flags.MOVED_TO | flags.DELETE_SELF)
+        self.ignored = ignore_matcher(ignore)
+        self.inotify = INotify()
+        self.dirs: Dict[int, str] = {}
+        self.add_tree(REPO_ROOT, "")
+
+    def add_tree(self, path: Path, prefix: str) -> set:
+        """Watch path and its subdirectories; returns solution files already inside."""
+        found = set()
+        stack = [(path, prefix)]
+        while stack:
+            dir_path, dir_prefix = stack.pop()
+            try:
+                wd = self.inotify.add_watch(str(dir_path), self.mask)
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue
+            self.dirs[wd] = dir_prefix
+            for entry in entries:
+                rel = dir_prefix + entry.name
+                if entry.name.startswith(".") or self.ignored(entry.name, rel):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((Path(entry.path), rel + "/"))
+                elif FILE_RE.match(entry.name):
+                    found.add(rel)
+        return found
+
+    def poll(self, timeout: Optional[float] = None) -> set:
+        """Same contract as PollingWatcher.poll(); unrelated events (README, config) are skipped."""
+        while True:
+            changed = self.read_events(None if timeout is None else int(timeout * 1000))
+            if changed or timeout is not None:
+                return changed
+
+    def read_events(self, timeout_ms: Optional[int]) -> set:
+        changed = set()
+        for event in self.inotify.read(timeout=timeout_ms):
+            prefix = self.dirs.get(event.wd)
+            if prefix is None or not event.name:
+                if event.mask & self.flags.IGNORED:
+                    self.dirs.pop(event.wd, None)
+                continue
+            rel = prefix + event.name
+            if event.name.startswith(".") or self.ignored(event.name, rel):
+                continue
+            if event.mask & self.flags.ISDIR:
+                if event.mask & (self.flags.CREATE | self.flags.MOVED_TO):
+                    changed |= self.add_tree(REPO_ROOT / rel, rel + "/")
+                else:
+                    # a directory went away; let the caller re-check what it held
+                    changed |= {rel + "/"}
+            elif FILE_RE.match(event.name):
+                changed.add(rel)
+        return changed
+
+def make_watcher(backend: str, ignore: Iterable[str], interval: float):
+    if backend in ("auto", "inotify"):
+        try:
+            return InotifyWatcher(ignore)
+        except (ImportError, OSError) as e:
+            if backend == "inotify":
+                raise SystemExit(f"❌ inotify backend unavailable: {e}")
+    return PollingWatcher(ignore, interval)
+
+def apply_changes(changed: Iterable[str], problems: Dict[str, Problem], stats: StatsAggregate, cache: dict) -> None:
+    """Re-parse changed paths and adjust the in-memory index, aggregate and cache."""
+    files = cache["files"]
+    for rel in changed:
+        # "dir/" means a whole directory was removed or moved away
+        targets = [k for k in problems if k.startswith(rel)] if rel.endswith("/") else [rel]
+        for target in targets:
+            old = problems.pop(target, None)
+            if old:
+                stats.remove(old)
+            path = REPO_ROOT / target
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                files.pop(target, None)
+                continue
+            prob, digest = parse_and_digest(path, target)
+            files[target] = cache_entry(st, prob, digest)
+            if prob:
+                problems[target] = prob
+                stats.add(prob)
+    cache["activity"] = stats.activity.to_dict()
+
+def refresh_manifest(config: dict, cache: dict) -> bool:
+    """Record the manifest of the files in cache; True if it differs from grind.json's."""
+    # the cache entries carry the size/mtime the last scan (or watch update) saw
+    manifest = build_manifest((rel, e["size"], e["mtime_ns"]) for rel, e in cache["files"].items())
+    changed = manifest != config["optimization"].get("manifest")
+    config["optimization"]["manifest"] = manifest
+    return changed
+
+def watch(config: dict, cache: dict, problems: ProblemStore, args: argparse.Namespace) -> None:
+    """
+    Keep the problem index in memory and re-render on change.
+    Events are debounced: after the first one, changes are collected
+    until the tree has been quiet for --debounce seconds.
+    """
+    import time
+
+    ignore = config.get("scan", {}).get("ignore", [])
+    index = {p.filename: p for p in problems}
+    stats = StatsAggregate.from_problems(problems, ActivityIndex.from_dict(cache["activity"]))
+    watcher = make_watcher(args.watch_backend, ignore, args.interval)
+    print(f"👀 Watching {len(index)} problems ({type(watcher).__name__}), Ctrl+C to stop")
+
+    try:
+        while True:
+            changed = watcher.poll()
+            while True:
+                more = watcher.poll(args.debounce)
+                if not more:
+                    break
+                changed |= more
+
+            start = time.perf_counter()
+            before = set(index)
+            apply_changes(changed, index, stats, cache)
+            if set(index) != before:
+                print_cph_report(normalize_cph_paths(index.values(), cache, gc=args.gc_cph))
+            save_cache(cache)
+            # same step as the README, so --check agrees with the tree after a watch session
+            manifest_changed = not args.no_manifest and refresh_manifest(config, cache)
+            if not update_readme(stats, config) and manifest_changed:
+                save_config(config)
+            print(f"🔁 {len(changed)} change(s) applied in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Update README stats from solution metadata.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="worker processes for parsing changed files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--gc-cph", action="store_true",
+        help="delete .cph/*.prob files whose solution file no longer exists",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="stay running and update stats as solution files change",
+    )
+    parser.add_argument(
+        "--watch-backend", choices=("auto", "poll", "inotify"), default="auto",
+        help="inotify needs the inotify_simple package; auto falls back to polling",
+    )
+    parser.add_argument("--interval", type=float, default=1.0, help="polling interval in seconds")
+    parser.add_argument("--debounce", type=float, default=0.3, help="quiet period before re-rendering")
+    parser.add_argument(
+        "--git", action="store_true",
+        help="only re-read files git reports changed since optimization.last_commit (stats as of HEAD)",
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="only stat solution files against grind.json's manifest; exit 1 if stats are stale",
+    )
+    parser.add_argument(
+        "--no-manifest", action="store_true",
+        help="don't record the file manifest (CI: checkout mtimes mean nothing locally)",
+    )
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.check:
+        raise SystemExit(check(REPO_ROOT, CONFIG_FILE))
+    config = load_config()
+    cache = load_cache()
+    ignore = config.get("scan", {}).get("ignore", [])
+    incremental = git_incremental(config, ignore) if args.git and not args.watch else None
+    manifest_changed = False
+    if incremental is not None:
+        stats, head, cph_dirty = incremental
+        cph_report = CphReport(0, [], 0)
+        if cph_dirty or args.gc_cph:
+            cph_report = normalize_cph_targets(cph_targets(git_solution_files(ignore)), cache, gc=args.gc_cph)
+            save_cache(cache)
+    else:
+        probs = scan_problems(cache, jobs=max(1, args.jobs), ignore=ignore)
+        cph_report = normalize_cph_paths(probs, cache, gc=args.gc_cph)
+        save_cache(cache)
+        if not args.no_manifest:
+            manifest_changed = refresh_manifest(config, cache)
+        activity = ActivityIndex.from_dict(cache["activity"])
+        stats = StatsAggregate.from_problems(probs, activity)
+        head = git_clean_head(ignore)
+    # a full scan under --git means the recorded commit couldn't be used
+    state_changed = record_git_state(config, stats, head, ignore, reset=args.git and incremental is None)
+    if not update_readme(stats, config) and (manifest_changed or state_changed):
+        save_config(config)
+    print_cph_report(cph_report)
+    if args.watch:
+        watch(config, cache, probs, args)
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,9 @@ def init_grind() -> None:
                     "min_count": 1
                 }
             },
+            "scan": {
+                "ignore": []
+            },
             "optimization": {
                 "last_update": None,
                 "total_files_scanned": 0,
@@ -83,6 +86,8 @@ def init_grind() -> None:
             "stats": {
                 "total_solved": 0,
                 "platforms": {},
+                "longest_streak": 0,
+                "activity": {},
                 "last_scan_timestamp": None
             }
         }
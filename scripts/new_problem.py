@@ -8,20 +8,22 @@ purpose:
 - infer platform (LeetCode, GFG, HackerRank, Codeforces)
 - generate a clean, readable filename
 - populate TEMPLATE.py
+- scaffold a whole list of URLs in one go (--batch)
 """
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 import json
-import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 TEMPLATE_PATH = REPO_ROOT / "TEMPLATE.py"
+TEMPLATE_CACHE = REPO_ROOT / "config" / "template.cache.json"
 
 PLATFORM_BY_HOST = {
     "leetcode.com": "LeetCode",
@@ -37,6 +39,9 @@ PLATFORM_BY_HOST = {
 
 INVALID_FS = set('<>:"/\\|?*')
 
+SOLVE_RE = re.compile(r"def\s+solve\s*\(\s*self\s*,\s*\*args\s*,\s*\*\*kwargs\s*\)\s*:")
+MAIN_RE = re.compile(r'if __name__ == "__main__":\s*[\s\S]*\Z')
+
 
 def platform_from_url(url: str) -> str:
     host = (urlparse(url).netloc or "").lower()
@@ -101,6 +106,8 @@ def to_filename(platform: str, title_slug: str, ext: str = "py") -> str:
 
 def create_cph_file(problem_path: Path) -> Path:
     """Create .cph file with relative path (.\\filename format)."""
+    import hashlib
+
     cph_dir = REPO_ROOT / ".cph"
     cph_dir.mkdir(parents=True, exist_ok=True)
 
@@ -137,12 +144,170 @@ def ensure_unique(path: Path) -> Path:
         i += 1
 
 
+def claim_unique(filename: str, taken: set, next_suffix: dict) -> str:
+    """In-memory ensure_unique(): `taken` holds names already in the repo root or claimed."""
+    if filename not in taken:
+        taken.add(filename)
+        return filename
+
+    stem, dot, suffix = filename.rpartition(".")
+    i = next_suffix.get(filename, 2)
+    while f"{stem}_{i}{dot}{suffix}" in taken:
+        i += 1
+    next_suffix[filename] = i + 1
+    candidate = f"{stem}_{i}{dot}{suffix}"
+    taken.add(candidate)
+    return candidate
+
+
+def plan_problem(url: str, ext: str) -> tuple[str, str]:
+    """Function name and filename for a problem URL."""
+    platform = platform_from_url(url)
+    title_slug = slugify_title(title_from_url(url, platform))
+    return slug_to_snake(title_slug), to_filename(platform, title_slug, ext)
+
+
+MAIN_BLOCK = (
+    'if __name__ == "__main__":\n'
+    "    solution = Solution()\n"
+    "    result = solution.", "function_name", "(*args, **kwargs)\n"
+    "    print(result)\n"
+)
+SOLVE_DEF = ("def ", "function_name", "(self, *args, **kwargs):")
+PLACEHOLDER_RE = re.compile(r"\{(problem_link|created)\}")
+SLOT_NAMES = ("problem_link", "created", "function_name")
+
+
+class ProblemTemplate:
+    """
+    TEMPLATE.py parsed into literal parts and named slots.
+    The slots are {problem_link}, {created}, the solve() method name and the
+    __main__ block (rewritten to call the renamed method), so render() is
+    a single join. Parsing happens once per template version; the parsed
+    form is cached on disk keyed by the template's hash.
+    """
+
+    def __init__(self, parts: list[str], slots: list[tuple[int, str]]):
+        self.parts = parts
+        self.slots = slots
+
+    @classmethod
+    def parse(cls, text: str) -> "ProblemTemplate":
+        pieces: list = []
+
+        def literal(chunk: str) -> None:
+            # split {problem_link} / {created} out of a literal chunk
+            pos = 0
+            for m in PLACEHOLDER_RE.finditer(chunk):
+                pieces.append(chunk[pos:m.start()])
+                pieces.append((m.group(1),))
+                pos = m.end()
+            pieces.append(chunk[pos:])
+
+        def fixed(seq: tuple) -> None:
+            for item in seq:
+                pieces.append((item,) if item in SLOT_NAMES else item)
+
+        main = MAIN_RE.search(text)
+        head = text[:main.start()] if main else text
+        solve = SOLVE_RE.search(head)
+        if solve:
+            literal(head[:solve.start()])
+            fixed(SOLVE_DEF)
+            literal(head[solve.end():])
+        else:
+            literal(head)
+        if main:
+            fixed(MAIN_BLOCK)
+
+        parts: list[str] = []
+        slots: list[tuple[int, str]] = []
+        for piece in pieces:
+            if isinstance(piece, tuple):
+                slots.append((len(parts), piece[0]))
+                parts.append("")
+            elif piece:
+                parts.append(piece)
+        return cls(parts, slots)
+
+    @classmethod
+    def load(cls, path: Path = TEMPLATE_PATH, cache_path: Path = TEMPLATE_CACHE) -> "ProblemTemplate":
+        import hashlib
+
+        text = path.read_text(encoding="utf-8")
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("sha1") == digest:
+                return cls(cached["parts"], [tuple(s) for s in cached["slots"]])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        template = cls.parse(text)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"sha1": digest, "parts": template.parts, "slots": template.slots}),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+        return template
+
+    def render(self, **values: str) -> str:
+        parts = self.parts[:]
+        for i, name in self.slots:
+            parts[i] = values[name]
+        return "".join(parts)
+
+
+def read_urls(source: str) -> list[str]:
+    """URLs from a file (or stdin for "-"), one per line; blanks and # comments skipped."""
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def batch(urls: list[str], ext: str) -> None:
+    """
+    Scaffold many problems in one process: the template is loaded once,
+    filename collisions are resolved against a single listing of the repo
+    root, and no editor is opened.
+    """
+    template = ProblemTemplate.load()
+    stamp = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    taken = set(os.listdir(REPO_ROOT))
+    next_suffix: dict = {}
+    seen_urls = set()
+
+    created = 0
+    for url in urls:
+        if url in seen_urls:
+            print(f"⏭️  Duplicate URL skipped: {url}")
+            continue
+        seen_urls.add(url)
+
+        function_name, filename = plan_problem(url, ext)
+        target = REPO_ROOT / claim_unique(filename, taken, next_suffix)
+        content = template.render(problem_link=url, created=stamp, function_name=function_name)
+        target.write_text(content, encoding="utf-8")
+        create_cph_file(target)
+        created += 1
+        print(f"✅ {target.relative_to(REPO_ROOT)}")
+
+    print(f"📦 Created {created} problem(s) with .cph files")
+
+
 def main() -> None:
     if len(sys.argv) < 2:
         print("usage: python scripts/new_problem.py <url> [--ext py]")
+        print("       python scripts/new_problem.py --batch <file|-> [--ext py]")
         raise SystemExit(1)
 
-    url = sys.argv[1].strip()
     ext = "py"
 
     if "--ext" in sys.argv:
@@ -153,41 +318,22 @@ def main() -> None:
     if not TEMPLATE_PATH.exists():
         raise SystemExit("❌ TEMPLATE.py not found in repo root.")
 
-    platform = platform_from_url(url)
-    raw_title = title_from_url(url, platform)
-    title_slug = slugify_title(raw_title)
+    if "--batch" in sys.argv:
+        idx = sys.argv.index("--batch")
+        if idx + 1 >= len(sys.argv):
+            raise SystemExit("❌ --batch needs a file of URLs (or - for stdin).")
+        batch(read_urls(sys.argv[idx + 1]), ext)
+        return
 
-    function_name = slug_to_snake(title_slug)
-    filename = to_filename(platform, title_slug, ext)
+    url = sys.argv[1].strip()
+    function_name, filename = plan_problem(url, ext)
     target = ensure_unique(REPO_ROOT / filename)
 
-    template = TEMPLATE_PATH.read_text(encoding="utf-8")
     stamp = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    template = ProblemTemplate.load()
+    content = template.render(problem_link=url, created=stamp, function_name=function_name)
 
-    template = (
-        template.replace("{problem_link}", url)
-        .replace("{created}", stamp)
-    )
-
-    template = re.sub(
-        r"def\s+solve\s*\(\s*self\s*,\s*\*args\s*,\s*\*\*kwargs\s*\)\s*:",
-        f"def {function_name}(self, *args, **kwargs):",
-        template,
-        count=1,
-    )
-
-    template = re.sub(
-        r'if __name__ == "__main__":\s*[\s\S]*\Z',
-        f'''if __name__ == "__main__":
-    solution = Solution()
-    result = solution.{function_name}(*args, **kwargs)
-    print(result)
-''',
-        template,
-        count=1,
-    )
-
-    target.write_text(template, encoding="utf-8")
+    target.write_text(content, encoding="utf-8")
     print(f"✅ Created: {target.relative_to(REPO_ROOT)}")
     print(f"🔧 Function name: {function_name}()")
 